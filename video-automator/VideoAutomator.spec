@@ -6,6 +6,7 @@ block_cipher = None
 added_files = [
     ('video-automator/resources/noise2.mp4', 'resources'),
     ('video-automator/models/base.pt', 'models'),
+    ('video-automator/models/faster-whisper-base', 'models/faster-whisper-base'),
 ]
 
 a = Analysis(
@@ -15,6 +16,8 @@ a = Analysis(
     datas=added_files,
     hiddenimports=[
         'whisper',
+        'faster_whisper',
+        'ctranslate2',
         'torch',
         'torchaudio',
         'torchvision',
@@ -22,8 +22,11 @@ if errorlevel 1 (
 echo.
 
 echo [3/5] Checking Whisper model...
-if not exist "video-automator\models\base.pt" (
-    echo Downloading Whisper model...
+set NEED_MODELS=
+if not exist "video-automator\models\base.pt" set NEED_MODELS=1
+if not exist "video-automator\models\faster-whisper-base\model.bin" set NEED_MODELS=1
+if defined NEED_MODELS (
+    echo Downloading Whisper models...
     python download_whisper_model.py
 )
 echo.
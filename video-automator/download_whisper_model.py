@@ -1,11 +1,13 @@
 """
 Download Whisper Base Model
-Run this once to download the model for bundling
+Run this once to download the models for bundling:
+models/base.pt (openai-whisper) and models/faster-whisper-base (CTranslate2)
 """
 
 import whisper
 import os
 import shutil
+from faster_whisper import download_model
 
 print("Downloading Whisper base model...")
 model = whisper.load_model("base")
@@ -31,3 +33,14 @@ if os.path.exists(model_file):
 else:
     print("Could not find cached model file")
     print(f"Expected location: {model_file}")
+
+# faster-whisper (default backend) loads converted CTranslate2 models, not base.pt
+print("Downloading faster-whisper base model...")
+ct2_destination = os.path.join(project_models_dir, "faster-whisper-base")
+download_model("base", output_dir=ct2_destination)
+
+size_mb = sum(
+    os.path.getsize(os.path.join(ct2_destination, name)) for name in os.listdir(ct2_destination)
+) / (1024 * 1024)
+print(f"Model copied to: {ct2_destination}")
+print(f"Model size: {size_mb:.1f} MB")
@@ -5,6 +5,7 @@ Batch video editor with automated captions and motion effects
 """
 
 import sys
+import multiprocessing
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtGui import QFont
 
@@ -23,4 +24,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # Required for transcription worker processes in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -9,20 +9,48 @@ import os
 from pathlib import Path
 
 from PyQt5.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QListWidget, QFrame, QMessageBox, QFileDialog, QListWidgetItem, QDialog,
+    QMainWindow, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
+    QListView, QFrame, QMessageBox, QFileDialog, QDialog,
     QInputDialog
 )
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont
 
-from video_processing import VideoProcessor, check_ffmpeg_installed, check_gpu_available
+from video_processing import VideoProcessor, BatchRenderer, check_ffmpeg_installed, check_nvenc_available
 from .settings_dialog import EnhancedSettingsDialog
-from .widgets.video_list_item import VideoListItem
+from .widgets.video_queue import VideoQueueModel, VideoQueueDelegate
 from .widgets.render_thread import RenderThread
 from .styles import Styles
 
 
+# Number of dragged URLs checked with isdir() during dragEnterEvent
+DRAG_PROBE_LIMIT = 4
+
+
+def _format_scan_summary(added: int, skipped: list, limit: int = 5, noun: str = "folder(s)") -> str:
+    """
+    Build the summary text shown after scanning or dropping folders
+
+    Args:
+        added: Number of folders added to the queue
+        skipped: List of (folder_name, reason) tuples for rejected folders
+        limit: Maximum number of skipped folders to list individually
+        noun: Label used for the added count
+
+    Returns:
+        Multi-line summary string
+    """
+    lines = [f"Added {added} {noun}", ""]
+
+    if skipped:
+        lines.append(f"Skipped {len(skipped)} folder(s):")
+        lines.extend(f"  • {name}: {reason}" for name, reason in skipped[:limit])
+        if len(skipped) > limit:
+            lines.append(f"  ... and {len(skipped) - limit} more")
+
+    return "\n".join(lines)
+
+
 class MainWindow(QMainWindow):
     """Main application window"""
     
@@ -39,7 +67,7 @@ class MainWindow(QMainWindow):
         self.settings = self.load_settings()
         
         # Video queue
-        self.video_queue = []
+        self.queue_model = VideoQueueModel(self)
         
         # Rendering thread
         self.render_thread = None
@@ -96,11 +124,11 @@ class MainWindow(QMainWindow):
                 "Visit: https://ffmpeg.org/download.html"
             )
         
-        gpu_available = check_gpu_available()
-        if gpu_available:
-            print("NVIDIA GPU detected - will use hardware acceleration")
+        nvenc_available = check_nvenc_available()
+        if nvenc_available:
+            print("NVENC encoder available - will use hardware acceleration")
         else:
-            print("No NVIDIA GPU detected - will use CPU encoding")
+            print("NVENC encoder not available - will use CPU encoding")
     
     def load_settings(self):
         """Load settings from config file"""
@@ -179,7 +207,12 @@ class MainWindow(QMainWindow):
     
     def init_ui(self):
         """Initialize the UI"""
-        central_widget = QWidget()
+        # Single framed drop zone so drag highlighting only re-polishes this widget
+        central_widget = QFrame()
+        central_widget.setObjectName("dropZone")
+        central_widget.setProperty("dragging", False)
+        central_widget.setStyleSheet(Styles.DROP_ZONE)
+        self.drop_zone = central_widget
         self.setCentralWidget(central_widget)
         
         main_layout = QVBoxLayout()
@@ -238,7 +271,10 @@ class MainWindow(QMainWindow):
         queue_label.setStyleSheet("color: #1976D2;")
         main_layout.addWidget(queue_label)
         
-        self.queue_list = QListWidget()
+        self.queue_list = QListView()
+        self.queue_list.setModel(self.queue_model)
+        self.queue_list.setItemDelegate(VideoQueueDelegate(self.queue_list))
+        self.queue_list.setUniformItemSizes(True)
         self.queue_list.setStyleSheet(Styles.LIST_WIDGET)
         main_layout.addWidget(self.queue_list)
         
@@ -275,9 +311,9 @@ class MainWindow(QMainWindow):
     
     def open_settings(self):
         """Open settings dialog"""
-        if self.video_queue:
+        if self.queue_model.videos:
             # Use first video in queue as sample
-            sample_folder = self.video_queue[0]['path']
+            sample_folder = self.queue_model.videos[0]['path']
             dialog = EnhancedSettingsDialog(self, self.settings, sample_folder)
         else:
             # No sample available, ask user
@@ -349,30 +385,25 @@ class MainWindow(QMainWindow):
         found_folders = []
         skipped_folders = []
         
+        # Each folder is scanned once - the scan result is handed to the queue
+        processor = VideoProcessor(self.settings)
         parent_path = Path(parent_folder)
         for subfolder in parent_path.iterdir():
             if subfolder.is_dir():
-                processor = VideoProcessor(self.settings)
-                is_valid, msg = processor.validate_folder(str(subfolder))
+                scan = processor.scan_folder(str(subfolder))
                 
-                if is_valid:
-                    found_folders.append(str(subfolder))
+                if scan[0]:
+                    found_folders.append((str(subfolder), scan))
                 else:
-                    skipped_folders.append((subfolder.name, msg))
+                    skipped_folders.append((subfolder.name, scan[1]))
         
         if found_folders:
-            for folder in found_folders:
-                self.add_folder_to_queue(folder, silent=True)
-            
-            summary = f"Added {len(found_folders)} video project(s)\n\n"
-
-            if skipped_folders:
-                summary += f"Skipped {len(skipped_folders)} folder(s):\n"
-                for name, reason in skipped_folders[:5]:
-                    summary += f"  • {name}: {reason}\n"
-                if len(skipped_folders) > 5:
-                    summary += f"  ... and {len(skipped_folders) - 5} more"
+            for folder, scan in found_folders:
+                self.add_folder_to_queue(folder, silent=True, scan=scan)
             
+            summary = _format_scan_summary(
+                len(found_folders), skipped_folders, noun="video project(s)"
+            )
             QMessageBox.information(self, "Scan Complete", summary)
             self.status_label.setText(f"Added {len(found_folders)} videos from scan")
         else:
@@ -386,29 +417,13 @@ class MainWindow(QMainWindow):
             )
             self.status_label.setText("No valid projects found")
     
-    def _sort_and_refresh_queue(self):
-        """Sort queue alphabetically and refresh the UI display"""
-        # Sort the queue by folder name (case-insensitive)
-        self.video_queue.sort(key=lambda x: x['name'].lower())
-
-        # Clear the QListWidget
-        self.queue_list.clear()
-
-        # Re-add all items in sorted order
-        for video in self.video_queue:
-            item = QListWidgetItem(self.queue_list)
-            item.setSizeHint(video['widget'].sizeHint())
-            self.queue_list.addItem(item)
-            self.queue_list.setItemWidget(item, video['widget'])
-            # Update the item reference
-            video['item'] = item
-
-    def add_folder_to_queue(self, folder_path, silent=False):
-        """Add a folder to the video queue"""
+    def add_folder_to_queue(self, folder_path, silent=False, scan=None):
+        """Add a folder to the video queue (scan: the caller's scan_folder result, if any)"""
         folder_name = os.path.basename(folder_path)
 
-        processor = VideoProcessor(self.settings)
-        is_valid, error_msg = processor.validate_folder(folder_path)
+        if scan is None:
+            scan = VideoProcessor(self.settings).scan_folder(folder_path)
+        is_valid, error_msg, detected = scan
 
         if not is_valid:
             if not silent:
@@ -422,56 +437,39 @@ class MainWindow(QMainWindow):
                 )
             return
 
-        detected = processor.detect_files(folder_path)
         num_images = len(detected['images'])
 
-        item_widget = VideoListItem(folder_name, num_images)
-        item = QListWidgetItem(self.queue_list)
-        item.setSizeHint(item_widget.sizeHint())
-
-        # Initially add to list (will be sorted later)
-        self.queue_list.addItem(item)
-        self.queue_list.setItemWidget(item, item_widget)
-
-        self.video_queue.append({
-            'path': folder_path,
-            'name': folder_name,
-            'item': item,
-            'widget': item_widget
-        })
-
-        # Sort the queue alphabetically after adding
-        self._sort_and_refresh_queue()
+        # Model inserts at the alphabetical position - no full rebuild
+        self.queue_model.add_video(folder_path, folder_name, num_images)
 
         self.start_btn.setEnabled(True)
 
         if not silent:
             self.status_label.setText(
                 f"Added: {folder_name} ({num_images} image(s)) • "
-                f"Total: {len(self.video_queue)} video(s)"
+                f"Total: {self.queue_model.rowCount()} video(s)"
             )
     
     def clear_queue(self):
         """Clear all items from queue"""
-        if not self.video_queue:
+        if not self.queue_model.videos:
             return
             
         reply = QMessageBox.question(
             self,
             "Clear Queue?",
-            f"Are you sure you want to remove all {len(self.video_queue)} video(s) from the queue?",
+            f"Are you sure you want to remove all {self.queue_model.rowCount()} video(s) from the queue?",
             QMessageBox.Yes | QMessageBox.No
         )
         
         if reply == QMessageBox.Yes:
-            self.queue_list.clear()
-            self.video_queue = []
+            self.queue_model.clear()
             self.start_btn.setEnabled(False)
             self.status_label.setText("Queue cleared")
     
     def start_rendering(self):
         """Start batch rendering process"""
-        if not self.video_queue:
+        if not self.queue_model.videos:
             return
         
         workers, ok = QInputDialog.getInt(
@@ -486,13 +484,25 @@ class MainWindow(QMainWindow):
         if not ok:
             return
         
+        # Tell the user when the GPU can't run that many NVENC encodes at once
+        requested_workers = workers
+        workers = BatchRenderer.limit_workers(self.settings, workers)
+        if workers < requested_workers:
+            QMessageBox.information(
+                self,
+                "Parallel Rendering Limited",
+                f"The NVENC session limit is {workers} simultaneous encode(s), "
+                f"so {workers} render(s) will run in parallel instead of {requested_workers}.\n\n"
+                "Set 'nvenc_session_limit' in the settings file to change this limit."
+            )
+        
         self.status_label.setText(
-            f"Starting batch render: {len(self.video_queue)} videos "
+            f"Starting batch render: {self.queue_model.rowCount()} videos "
             f"with {workers} parallel worker(s)..."
         )
         self.start_btn.setEnabled(False)
         
-        folder_paths = [video['path'] for video in self.video_queue]
+        folder_paths = [video['path'] for video in self.queue_model.videos]
         
         self.render_thread = RenderThread(
             folder_paths,
@@ -508,29 +518,27 @@ class MainWindow(QMainWindow):
     
     def on_progress_update(self, folder_path, progress, status):
         """Handle progress updates"""
-        for video in self.video_queue:
-            if video['path'] == folder_path:
-                video['widget'].update_progress(progress, status)
-                break
+        self.queue_model.update_progress(folder_path, progress, status)
     
     def on_render_complete(self, folder_path, success, output_path):
         """Handle individual video completion"""
-        for video in self.video_queue:
-            if video['path'] == folder_path:
-                if success:
-                    video['widget'].set_complete()
-                    self.status_label.setText(f"Completed: {video['name']} → {output_path}")
-                else:
-                    video['widget'].set_error("Rendering failed")
-                    self.status_label.setText(f"Failed: {video['name']}")
-                break
+        video = self.queue_model.video_for_path(folder_path)
+        if video is None:
+            return
+
+        if success:
+            self.queue_model.set_complete(folder_path)
+            self.status_label.setText(f"Completed: {video['name']} → {output_path}")
+        else:
+            self.queue_model.set_error(folder_path, "Rendering failed")
+            self.status_label.setText(f"Failed: {video['name']}")
     
     def on_all_complete(self):
         """Handle completion of all videos"""
         self.start_btn.setEnabled(True)
         
         output_list = "\n".join([f"  • {video['name']}.mp4" 
-                                 for video in self.video_queue])
+                                 for video in self.queue_model.videos])
         
         QMessageBox.information(
             self,
@@ -542,27 +550,36 @@ class MainWindow(QMainWindow):
         )
         
         self.status_label.setText(
-            f"All {len(self.video_queue)} video(s) complete! "
+            f"All {self.queue_model.rowCount()} video(s) complete! "
             "Check your project folders for MP4 files."
         )
     
+    def _set_drag_highlight(self, active):
+        """Toggle drop zone highlight, re-polishing only the drop zone frame"""
+        if self.drop_zone.property("dragging") == active:
+            return
+        self.drop_zone.setProperty("dragging", active)
+        self.drop_zone.style().unpolish(self.drop_zone)
+        self.drop_zone.style().polish(self.drop_zone)
+
     def dragEnterEvent(self, event):
         """Handle drag enter"""
         if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
+            # Only probe the first few URLs while hovering - dropEvent re-validates all of them
+            for url in event.mimeData().urls()[:DRAG_PROBE_LIMIT]:
                 if os.path.isdir(url.toLocalFile()):
                     event.acceptProposedAction()
-                    self.setStyleSheet(Styles.MAIN_WINDOW_DRAG)
+                    self._set_drag_highlight(True)
                     return
         event.ignore()
     
     def dragLeaveEvent(self, event):
         """Handle drag leave"""
-        self.setStyleSheet(Styles.MAIN_WINDOW)
+        self._set_drag_highlight(False)
     
     def dropEvent(self, event):
         """Handle drop"""
-        self.setStyleSheet(Styles.MAIN_WINDOW)
+        self._set_drag_highlight(False)
         
         folders = []
         for url in event.mimeData().urls():
@@ -576,10 +593,11 @@ class MainWindow(QMainWindow):
         if len(folders) == 1:
             folder = folders[0]
             processor = VideoProcessor(self.settings)
-            is_valid, msg = processor.validate_folder(folder)
+            scan = processor.scan_folder(folder)
+            is_valid, msg, _ = scan
             
             if is_valid:
-                self.add_folder_to_queue(folder)
+                self.add_folder_to_queue(folder, scan=scan)
             else:
                 reply = QMessageBox.question(
                     self,
@@ -607,24 +625,17 @@ class MainWindow(QMainWindow):
                 added = 0
                 skipped = []
                 
+                processor = VideoProcessor(self.settings)
                 for folder in folders:
-                    processor = VideoProcessor(self.settings)
-                    is_valid, msg = processor.validate_folder(folder)
+                    scan = processor.scan_folder(folder)
                     
-                    if is_valid:
-                        self.add_folder_to_queue(folder, silent=True)
+                    if scan[0]:
+                        self.add_folder_to_queue(folder, silent=True, scan=scan)
                         added += 1
                     else:
-                        skipped.append((os.path.basename(folder), msg))
-                
-                summary = f"Added {added} folder(s)\n\n"
-                if skipped:
-                    summary += f"Skipped {len(skipped)} folder(s):\n"
-                    for name, reason in skipped[:5]:
-                        summary += f"  • {name}: {reason}\n"
-                    if len(skipped) > 5:
-                        summary += f"  ... and {len(skipped) - 5} more"
+                        skipped.append((os.path.basename(folder), scan[1]))
                 
+                summary = _format_scan_summary(added, skipped)
                 QMessageBox.information(self, "Drop Complete", summary)
                 self.status_label.setText(f"Added {added} videos via drag & drop")
                 
@@ -632,9 +643,9 @@ class MainWindow(QMainWindow):
                 total_added = 0
                 
                 for folder in folders:
-                    before = len(self.video_queue)
+                    before = self.queue_model.rowCount()
                     self.scan_and_add_folders(folder)
-                    after = len(self.video_queue)
+                    after = self.queue_model.rowCount()
                     total_added += (after - before)
                 
                 self.status_label.setText(
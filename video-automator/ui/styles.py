@@ -208,21 +208,22 @@ class Styles:
         }
     """
     
+    # Row padding/separators are painted by VideoQueueDelegate
     LIST_WIDGET = """
-        QListWidget {
+        QListView {
             border: 2px solid #ddd;
             border-radius: 8px;
             background-color: #fafafa;
         }
-        QListWidget::item {
-            border-bottom: 1px solid #eee;
-            padding: 5px;
-        }
     """
     
     MAIN_WINDOW = "QMainWindow { background-color: white; }"
 
-    MAIN_WINDOW_DRAG = "QMainWindow { background-color: #E3F2FD; }"
+    # Central drop zone - highlight is toggled via the "dragging" property
+    DROP_ZONE = """
+        QFrame#dropZone { background-color: white; }
+        QFrame#dropZone[dragging="true"] { background-color: #E3F2FD; }
+    """
 
     # Settings Dialog Styles
     SETTINGS_GROUPBOX = """
@@ -6,13 +6,14 @@ Custom PyQt5 widgets for video automator
 from .crop_view import ImageCropView
 from .caption_item import DraggableCaptionItem
 from .motion_preview import MotionEffectPreview
-from .video_list_item import VideoListItem
+from .video_queue import VideoQueueModel, VideoQueueDelegate
 from .render_thread import RenderThread
 
 __all__ = [
     'ImageCropView',
     'DraggableCaptionItem',
     'MotionEffectPreview',
-    'VideoListItem',
+    'VideoQueueModel',
+    'VideoQueueDelegate',
     'RenderThread'
 ]
\ No newline at end of file
@@ -0,0 +1,246 @@
+"""
+Video Queue Model and Delegate
+Model/view implementation of the render queue - rows are plain dicts painted
+by a delegate, so only visible rows cost anything to draw
+"""
+
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyle, QApplication
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QRectF, QSize
+from PyQt5.QtGui import QFont, QFontMetrics, QColor, QPen, QPainter
+
+
+class VideoQueueModel(QAbstractListModel):
+    """List model holding render queue entries sorted by folder name"""
+
+    # Custom data roles
+    PathRole = Qt.UserRole + 1
+    ImageCountRole = Qt.UserRole + 2
+    ProgressRole = Qt.UserRole + 3
+    StatusRole = Qt.UserRole + 4
+    StateRole = Qt.UserRole + 5
+
+    # Row states
+    STATE_QUEUED = 'queued'
+    STATE_COMPLETE = 'complete'
+    STATE_ERROR = 'error'
+
+    def __init__(self, parent=None):
+        """
+        Initialize video queue model
+
+        Args:
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._videos = []
+        self._row_by_path = {}
+
+    @property
+    def videos(self):
+        """Queue entries in display order (treat as read-only)"""
+        return self._videos
+
+    def rowCount(self, parent=QModelIndex()):
+        """Number of queued videos"""
+        if parent.isValid():
+            return 0
+        return len(self._videos)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Return data for the given row and role"""
+        if not index.isValid() or not 0 <= index.row() < len(self._videos):
+            return None
+
+        video = self._videos[index.row()]
+        if role == Qt.DisplayRole:
+            return video['name']
+        if role == self.PathRole:
+            return video['path']
+        if role == self.ImageCountRole:
+            return video['num_images']
+        if role == self.ProgressRole:
+            return video['progress']
+        if role == self.StatusRole:
+            return video['status']
+        if role == self.StateRole:
+            return video['state']
+        return None
+
+    def add_video(self, folder_path, folder_name, num_images):
+        """
+        Insert a video at its alphabetical position (case-insensitive)
+
+        Args:
+            folder_path: Path to the video project folder
+            folder_name: Display name of the folder
+            num_images: Number of images in the project
+        """
+        key = folder_name.lower()
+        row = len(self._videos)
+        for i, video in enumerate(self._videos):
+            if video['name'].lower() > key:
+                row = i
+                break
+
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._videos.insert(row, {
+            'path': folder_path,
+            'name': folder_name,
+            'num_images': num_images,
+            'progress': 0,
+            'status': "Queued",
+            'state': self.STATE_QUEUED
+        })
+        self._rebuild_index()
+        self.endInsertRows()
+
+    def clear(self):
+        """Remove all videos from the queue"""
+        self.beginResetModel()
+        self._videos = []
+        self._row_by_path = {}
+        self.endResetModel()
+
+    def video_for_path(self, folder_path):
+        """Return the queue entry for a folder path, or None"""
+        row = self._row_by_path.get(folder_path)
+        return None if row is None else self._videos[row]
+
+    def update_progress(self, folder_path, value, status="Processing..."):
+        """Update progress and status of a video"""
+        self._update(folder_path, progress=value, status=status)
+
+    def set_complete(self, folder_path):
+        """Mark a video as complete"""
+        self._update(folder_path, progress=100, status="Complete!", state=self.STATE_COMPLETE)
+
+    def set_error(self, folder_path, error_msg="Error"):
+        """Mark a video as failed"""
+        self._update(folder_path, progress=0, status=error_msg, state=self.STATE_ERROR)
+
+    def _update(self, folder_path, **changes):
+        """Apply changes to one row and repaint only that row"""
+        row = self._row_by_path.get(folder_path)
+        if row is None:
+            return
+
+        self._videos[row].update(changes)
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [self.ProgressRole, self.StatusRole, self.StateRole])
+
+    def _rebuild_index(self):
+        """Rebuild the path -> row lookup (first occurrence wins)"""
+        self._row_by_path = {}
+        for row, video in enumerate(self._videos):
+            self._row_by_path.setdefault(video['path'], row)
+
+
+class VideoQueueDelegate(QStyledItemDelegate):
+    """Paints queue rows: folder name, progress bar and status line"""
+
+    MARGIN = 13  # item padding + content margins
+    SPACING = 4  # between name, progress bar and status line
+    BAR_HEIGHT = 22  # minimum - grows with the bar font
+
+    # (border, background) colours per state, matching Styles.PROGRESS_BAR*
+    BAR_COLORS = {
+        VideoQueueModel.STATE_QUEUED: ('#ccc', '#f0f0f0'),
+        VideoQueueModel.STATE_COMPLETE: ('#4CAF50', '#e8f5e9'),
+        VideoQueueModel.STATE_ERROR: ('#f44336', '#ffebee'),
+    }
+    CHUNK_COLOR = '#4CAF50'
+
+    STATUS_COLORS = {
+        VideoQueueModel.STATE_QUEUED: '#666',
+        VideoQueueModel.STATE_COMPLETE: '#4CAF50',
+        VideoQueueModel.STATE_ERROR: '#f44336',
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.name_font = QFont('Arial', 11, QFont.Bold)
+        self.bar_font = QFont('Arial', 9)
+        self.status_font = QFont('Arial')
+        self.status_font.setPixelSize(10)
+        self.status_bold_font = QFont(self.status_font)
+        self.status_bold_font.setBold(True)
+
+    def _line_heights(self):
+        """Heights of the name line, progress bar and status line for the current fonts/DPI"""
+        name_height = QFontMetrics(self.name_font).height()
+        bar_height = max(self.BAR_HEIGHT, QFontMetrics(self.bar_font).height() + 6)
+        status_height = QFontMetrics(self.status_bold_font).height()
+        return name_height, bar_height, status_height
+
+    def sizeHint(self, option, index):
+        """Rows tall enough for all three lines at the current font metrics"""
+        name_height, bar_height, status_height = self._line_heights()
+        height = (
+            2 * self.MARGIN + name_height + bar_height + status_height + 2 * self.SPACING
+        )
+        return QSize(option.rect.width(), height)
+
+    def paint(self, painter, option, index):
+        """Draw one queue row"""
+        name = index.data(Qt.DisplayRole)
+        num_images = index.data(VideoQueueModel.ImageCountRole)
+        progress = index.data(VideoQueueModel.ProgressRole)
+        status = index.data(VideoQueueModel.StatusRole)
+        state = index.data(VideoQueueModel.StateRole)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Selection / hover background from the current style
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+
+        # Row separator
+        rect = option.rect
+        painter.setPen(QPen(QColor('#eee'), 1))
+        painter.drawLine(rect.bottomLeft(), rect.bottomRight())
+
+        content = rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        name_height, bar_height, status_height = self._line_heights()
+
+        # Folder name with image count
+        painter.setFont(self.name_font)
+        painter.setPen(QColor('#000'))
+        painter.drawText(
+            content.left(), content.top(), content.width(), name_height,
+            Qt.AlignLeft | Qt.AlignVCenter,
+            f"{name} ({num_images} image{'s' if num_images != 1 else ''})"
+        )
+
+        # Progress bar
+        bar_top = content.top() + name_height + self.SPACING
+        bar_rect = QRectF(content.left() + 1, bar_top + 1, content.width() - 2, bar_height - 2)
+        border_color, bg_color = self.BAR_COLORS.get(state, self.BAR_COLORS[VideoQueueModel.STATE_QUEUED])
+
+        painter.setPen(QPen(QColor(border_color), 2))
+        painter.setBrush(QColor(bg_color))
+        painter.drawRoundedRect(bar_rect, 5, 5)
+
+        if progress > 0 and state != VideoQueueModel.STATE_ERROR:
+            chunk_rect = bar_rect.adjusted(2, 2, -2, -2)
+            chunk_rect.setWidth(chunk_rect.width() * min(progress, 100) / 100.0)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(self.CHUNK_COLOR))
+            painter.drawRoundedRect(chunk_rect, 3, 3)
+
+        painter.setFont(self.bar_font)
+        painter.setPen(QColor('#000'))
+        painter.drawText(bar_rect, Qt.AlignCenter, f"{progress}%")
+
+        # Status line
+        status_top = bar_top + bar_height + self.SPACING
+        is_final = state != VideoQueueModel.STATE_QUEUED
+        painter.setFont(self.status_bold_font if is_final else self.status_font)
+        painter.setPen(QColor(self.STATUS_COLORS.get(state, '#666')))
+        painter.drawText(
+            content.left(), status_top, content.width(), status_height,
+            Qt.AlignLeft | Qt.AlignTop,
+            status
+        )
+
+        painter.restore()
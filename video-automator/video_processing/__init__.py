@@ -4,22 +4,30 @@ Handles all video rendering, caption generation, and FFmpeg operations
 """
 
 from .config import VideoConfig
-from .utils import check_ffmpeg_installed, check_gpu_available
+from .utils import check_ffmpeg_installed, check_nvenc_available
 from .whisper_handler import WhisperHandler
+from .script_aligner import ScriptAligner
 from .caption_generator import CaptionGenerator
+from .caption_overlay import CaptionOverlayRenderer
 from .subtitle_style import SubtitleStyleBuilder
 from .motion_effects import MotionEffectBuilder
+from .image_prescaler import ImagePrescaler
+from .transcript_cache import TranscriptCache
 from .ffmpeg_builder import FFmpegCommandBuilder
 from .batch_renderer import BatchRenderer, VideoProcessor
 
 __all__ = [
     'VideoConfig',
     'check_ffmpeg_installed',
-    'check_gpu_available',
+    'check_nvenc_available',
     'WhisperHandler',
+    'ScriptAligner',
     'CaptionGenerator',
+    'CaptionOverlayRenderer',
     'SubtitleStyleBuilder',
     'MotionEffectBuilder',
+    'ImagePrescaler',
+    'TranscriptCache',
     'FFmpegCommandBuilder',
     'BatchRenderer',
     'VideoProcessor'
@@ -4,25 +4,148 @@ Main classes for video assembly and batch processing
 """
 
 import os
+import shutil
+import asyncio
 import logging
+import multiprocessing
 import subprocess
+import tempfile
+import time
+from collections import deque
 from pathlib import Path
 from typing import Dict, List, Tuple, Callable, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from .config import VideoConfig
 from .whisper_handler import WhisperHandler
+from .script_aligner import ScriptAligner
 from .caption_generator import CaptionGenerator
+from .caption_overlay import CaptionOverlayRenderer
 from .ffmpeg_builder import FFmpegCommandBuilder
+from .image_prescaler import ImagePrescaler, CACHE_DIR_NAME
+from .transcript_cache import TranscriptCache
 from .utils import (
     detect_files_in_folder,
     validate_folder,
-    get_audio_duration
+    scan_folder,
+    detect_caption_sources,
+    get_audio_duration,
+    check_nvenc_available
 )
 from utils.resource_path import get_resource_path
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between FFmpeg progress callbacks (~4 Hz is plenty for the UI)
+PROGRESS_UPDATE_INTERVAL = 0.25
+
+
+# Default cap on concurrent NVENC encode sessions - GeForce drivers enforce
+# a per-system limit (8 on current drivers, 3 or 5 on older ones), pro cards
+# have none. Override with settings['nvenc_session_limit'] (None = no limit)
+NVENC_SESSION_LIMIT = 8
+
+# Pipe read size / StreamReader line limit for FFmpeg's stdout and stderr
+PIPE_CHUNK_SIZE = 1 << 16
+PIPE_LINE_LIMIT = 1 << 20
+
+# -progress keys the progress reader decodes (every other line is skipped as raw bytes)
+PROGRESS_KEYS = frozenset({b'out_time_ms', b'speed'})
+
+
+async def _drain_stream_async(stream: asyncio.StreamReader, sink: deque):
+    """
+    Read a pipe to EOF, keeping the most recent raw lines in sink (decoded only if reported)
+
+    Reads fixed-size chunks rather than lines, so no line length can make
+    the reader fail and leave FFmpeg blocked on a full pipe.
+    """
+    pending = b''
+    while True:
+        chunk = await stream.read(PIPE_CHUNK_SIZE)
+        if not chunk:
+            break
+        *lines, pending = (pending + chunk).split(b'\n')
+        # Stored lines are capped so a runaway line can't bloat the error tail
+        sink.extend(line[:PIPE_CHUNK_SIZE] for line in lines)
+        if len(pending) > PIPE_LINE_LIMIT:
+            sink.append(pending[:PIPE_CHUNK_SIZE])
+            pending = b''
+    if pending:
+        sink.append(pending[:PIPE_CHUNK_SIZE])
+
+
+async def _read_progress_async(
+    stream: asyncio.StreamReader,
+    duration: float,
+    progress_callback: Optional[Callable[[int, str], None]]
+):
+    """Parse FFmpeg's -progress blocks from a pipe and forward throttled updates"""
+    last_update_progress = 0
+    last_update_time = 0.0
+    fields = {}
+
+    while True:
+        try:
+            raw_line = await stream.readline()
+        except ValueError as e:
+            # Over the line limit - StreamReader has already discarded it
+            logger.warning(f"Skipped oversized FFmpeg progress line: {e}")
+            continue
+        if not raw_line:
+            break
+
+        key, _, value = raw_line.strip().partition(b'=')
+        if key != b'progress':
+            if key in PROGRESS_KEYS:
+                fields[key.decode('ascii', errors='ignore')] = value.decode('ascii', errors='ignore')
+            continue
+
+        # 'progress' closes each block: 'continue' while encoding, 'end' when done
+        if progress_callback:
+            try:
+                progress, status = FFmpegCommandBuilder.parse_progress(fields, duration)
+                now = time.monotonic()
+                if progress > last_update_progress and now - last_update_time >= PROGRESS_UPDATE_INTERVAL:
+                    last_update_progress = progress
+                    last_update_time = now
+                    progress_callback(progress, status)
+            except Exception as e:
+                logger.warning(f"Progress update failed: {e}")
+
+        fields = {}
+        if value == b'end':
+            break
+
+    # Keep the pipe drained until EOF so FFmpeg never blocks writing to it
+    while await stream.read(PIPE_CHUNK_SIZE):
+        pass
+
+
+# Per-process VideoProcessor used by transcription worker processes
+_WORKER_PROCESSOR = None
+
+
+def _generate_captions_in_worker(
+    settings: Dict,
+    voiceover_path: str,
+    script_path: Optional[str],
+    batch_size: int
+) -> List[Dict]:
+    """
+    Transcription worker entry point (runs in a ProcessPoolExecutor child)
+
+    The processor - and so the Whisper model - is created once per worker
+    process and reused for every folder it handles. Results also land in
+    the on-disk transcript cache.
+    """
+    global _WORKER_PROCESSOR
+
+    if _WORKER_PROCESSOR is None:
+        _WORKER_PROCESSOR = VideoProcessor(settings)
+
+    return _WORKER_PROCESSOR.generate_captions(voiceover_path, script_path, batch_size=batch_size)
+
 
 class VideoProcessor:
     """Main video processor - handles single video assembly"""
@@ -43,7 +166,15 @@ class VideoProcessor:
             config = VideoConfig(resolution=resolution)
 
         self.config = config
-        self.whisper_handler = WhisperHandler()
+        self.whisper_handler = WhisperHandler(
+            settings.get('whisper_backend', 'auto'),
+            word_timestamps=settings.get('word_timestamps', False),
+            model_size=settings.get('whisper_model', 'base'),
+            precision=settings.get('whisper_precision', 'auto')
+        )
+        self.script_aligner = ScriptAligner(settings.get('script_language', 'eng'))
+        self.transcript_cache = TranscriptCache() if settings.get('transcript_cache', True) else None
+        self._duration_cache = {}
 
         config_info = self.config.get_info()
         logger.info(f"Video Config: {config_info['fps_name']}, Quality: {config_info['quality_name']}, Resolution: {config_info['resolution_name']}")
@@ -58,150 +189,325 @@ class VideoProcessor:
     def validate_folder(self, folder_path: str) -> Tuple[bool, str]:
         """Validate folder - wrapper for utils function"""
         return validate_folder(folder_path)
+
+    def scan_folder(self, folder_path: str) -> Tuple[bool, str, Dict]:
+        """Validate folder and detect files in one pass - wrapper for utils function"""
+        return scan_folder(folder_path)
     
+    def get_audio_duration(self, audio_path: str) -> float:
+        """Get audio duration in seconds, cached per path"""
+        if audio_path not in self._duration_cache:
+            self._duration_cache[audio_path] = get_audio_duration(audio_path)
+        return self._duration_cache[audio_path]
+
+    def generate_captions(
+        self,
+        voiceover_path: str,
+        script_path: Optional[str] = None,
+        progress_callback: Optional[Callable[[int, str], None]] = None,
+        batch_size: int = 1
+    ) -> List[Dict]:
+        """
+        Generate caption segments for a voiceover
+
+        Aligns script.txt to the audio when present (and the aligner is
+        installed), otherwise transcribes with Whisper - Whisper results are
+        cached on disk by audio content hash, so unchanged voiceovers are
+        never transcribed twice.
+
+        Args:
+            voiceover_path: Path to voiceover audio
+            script_path: Optional path to script.txt
+            progress_callback: Optional callback for progress updates
+            batch_size: Whisper batch size (faster-whisper only)
+
+        Returns:
+            List of caption dictionaries with 'start', 'end', 'text' keys
+        """
+        if script_path and ScriptAligner.is_available():
+            if progress_callback:
+                progress_callback(5, "Aligning script to voiceover...")
+            try:
+                return self.script_aligner.align(voiceover_path, script_path)
+            except Exception as e:
+                logger.warning(f"Script alignment failed ({e}) - falling back to Whisper")
+
+        cache_key = None
+        if self.transcript_cache:
+            try:
+                cache_key = TranscriptCache.make_key(
+                    voiceover_path, self.whisper_handler.cache_tag(batch_size)
+                )
+            except OSError as e:
+                logger.warning(f"Could not hash {voiceover_path} for transcript cache: {e}")
+            else:
+                cached = self.transcript_cache.get(cache_key)
+                if cached is not None:
+                    if progress_callback:
+                        progress_callback(5, "Captions loaded from cache")
+                    return cached
+
+        if progress_callback:
+            progress_callback(5, "Generating captions with Whisper...")
+
+        captions = self.whisper_handler.transcribe(voiceover_path, batch_size=batch_size)
+        if cache_key:
+            self.transcript_cache.put(cache_key, captions)
+        return captions
+
     def assemble_video(
         self,
         folder_path: str,
         progress_callback: Optional[Callable[[int, str], None]] = None,
-        use_gpu: bool = True
+        use_gpu: bool = True,
+        captions: Optional[List[Dict]] = None
     ) -> Tuple[bool, str]:
         """
-        Assemble final video from components
+        Assemble final video from components (blocking wrapper around assemble_video_async)
         
         Args:
             folder_path: Path to video project folder
             progress_callback: Optional callback for progress updates
             use_gpu: Whether to use GPU acceleration
+            captions: Pre-generated caption segments (skips Whisper when given)
             
+        Returns:
+            Tuple of (success, output_path)
+        """
+        return asyncio.run(
+            self.assemble_video_async(folder_path, progress_callback, use_gpu, captions)
+        )
+
+    async def assemble_video_async(
+        self,
+        folder_path: str,
+        progress_callback: Optional[Callable[[int, str], None]] = None,
+        use_gpu: bool = True,
+        captions: Optional[List[Dict]] = None
+    ) -> Tuple[bool, str]:
+        """
+        Assemble final video from components
+
+        Preparation (captions, image pre-scaling) runs in a worker thread; FFmpeg
+        runs as an asyncio subprocess, so one event loop can drive several renders.
+
+        Args:
+            folder_path: Path to video project folder
+            progress_callback: Optional callback for progress updates
+            use_gpu: Whether to use GPU acceleration
+            captions: Pre-generated caption segments (skips Whisper when given)
+
         Returns:
             Tuple of (success, output_path)
         """
         try:
-            logger.info("=" * 80)
-            logger.info("STARTING VIDEO ASSEMBLY")
-            logger.info("=" * 80)
-            logger.info(f"Folder: {folder_path}")
-            logger.info("Settings:")
-            logger.info(f"  - Font: {self.settings.get('font', 'N/A')}")
-            logger.info(f"  - Font Size: {self.settings.get('font_size', 'N/A')}")
-            logger.info(f"  - Text Color: {self.settings.get('text_color', 'N/A')}")
-            logger.info(f"  - BG Color: {self.settings.get('bg_color', 'N/A')}")
-            logger.info(f"  - BG Opacity: {self.settings.get('bg_opacity', 'N/A')}%")
-            logger.info(f"  - Has Background: {self.settings.get('has_background', 'N/A')}")
-            logger.info(f"  - Has Outline: {self.settings.get('has_outline', 'N/A')}")
-            logger.info(f"  - Outline Color: {self.settings.get('outline_color', 'N/A')}")
-            logger.info(f"  - Motion Effect: {self.settings.get('motion_effect', 'N/A')}")
-            logger.info(f"  - Caption Position: {self.settings.get('caption_position', 'N/A')}")
-            logger.info(f"  - Crop Settings: {self.settings.get('crop_settings', 'N/A')}")
-            logger.info("=" * 80)
-            
-            # Detect and validate files
-            files = detect_files_in_folder(folder_path)
-            is_valid, error = validate_folder(folder_path)
-            if not is_valid:
-                logger.error(f"Validation failed: {error}")
-                return False, ""
-            
-            # Prepare output path
-            folder_name = os.path.basename(folder_path)
-            output_path = os.path.join(folder_path, f"{folder_name}.mp4")
-            
-            # Get audio duration
-            duration = get_audio_duration(files['voiceover'])
-            num_images = len(files['images'])
-            logger.info(f"Video duration: {duration:.2f} seconds, Images: {num_images}")
-            
-            # Generate captions with Whisper
-            if progress_callback:
-                progress_callback(5, "Generating captions with Whisper...")
-            
-            captions = self.whisper_handler.transcribe(files['voiceover'])
-            
-            # Create SRT file with natural wrapping approach
-            # Max 15 words / 75 chars - let FFmpeg WrapStyle=2 handle line breaks naturally
-            # This reduces caption cuts and allows text to flow smoothly to 2-3 lines
-            temp_srt = os.path.join(folder_path, 'temp_captions.srt')
-            text_case = self.settings.get('text_case', 'title')
-            CaptionGenerator.create_srt_file(captions, temp_srt, max_words=15, max_chars=75, text_case=text_case)
-            
-            # Build and run FFmpeg command
-            if progress_callback:
-                progress_callback(20, f"Assembling video with {num_images} image(s)...")
-            
-            ffmpeg_builder = FFmpegCommandBuilder(self.settings, self.config)
-            ffmpeg_cmd = ffmpeg_builder.build_command(
-                files, temp_srt, duration, output_path, use_gpu
+            job = await asyncio.to_thread(
+                self._prepare_render, folder_path, progress_callback, use_gpu, captions
             )
-            
-            logger.info("Running FFmpeg...")
-            logger.info(f"FFmpeg command: {' '.join(ffmpeg_cmd)}")
-
-            # Prepare environment for bundled fonts (EB Garamond)
-            env = os.environ.copy()
-            font = self.settings.get('font', 'Arial Bold')
-
-            if 'EB Garamond' in font:
-                # Use bundled EB Garamond fonts by setting fontconfig file
-                fonts_dir = get_resource_path('resources/fonts')
-                fonts_conf = os.path.join(fonts_dir, 'fonts.conf')
-
-                if os.path.exists(fonts_conf):
-                    # Set fontconfig to use our custom configuration
-                    env['FONTCONFIG_FILE'] = fonts_conf
-                    env['FONTCONFIG_PATH'] = fonts_dir
-                    logger.info(f"Using bundled EB Garamond fonts from: {fonts_dir}")
-                    logger.info(f"Fontconfig file: {fonts_conf}")
-
-            # Execute FFmpeg with progress tracking
-            process = subprocess.Popen(
-                ffmpeg_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True,
-                bufsize=1,
-                env=env
-            )
-            
-            last_update_progress = 0
-            stderr_output = []
-            
-            for line in process.stderr:
-                stderr_output.append(line)
-                
-                if progress_callback:
-                    progress, status = FFmpegCommandBuilder.parse_progress(line, duration)
-                    if progress > last_update_progress:
-                        last_update_progress = progress
-                        progress_callback(progress, status)
-            
-            process.wait()
-            
-            if progress_callback and process.returncode == 0:
-                progress_callback(99, "Finalizing video...")
-            
-            # Cleanup
-            if os.path.exists(temp_srt):
-                os.remove(temp_srt)
-            
+            if job is None:
+                return False, ""
+
+            try:
+                logger.info("Running FFmpeg...")
+                logger.info(f"FFmpeg command: {' '.join(job['cmd'])}")
+
+                returncode, stderr_output = await self._run_ffmpeg(
+                    job['cmd'], job['env'], job['duration'], progress_callback
+                )
+            finally:
+                # Cleanup (keep_srt leaves the SRT next to the video for editing)
+                if os.path.exists(job['temp_srt']) and not self.settings.get('keep_srt', False):
+                    os.remove(job['temp_srt'])
+                shutil.rmtree(job['work_dir'], ignore_errors=True)
+
             # Check result
-            if process.returncode == 0:
+            output_path = job['output_path']
+            if returncode == 0:
+                if progress_callback:
+                    progress_callback(99, "Finalizing video...")
                 logger.info(f"Video created successfully: {output_path}")
                 if progress_callback:
                     progress_callback(100, "Complete!")
                 return True, output_path
             else:
-                logger.error(f"FFmpeg failed with return code {process.returncode}")
+                logger.error(f"FFmpeg failed with return code {returncode}")
                 logger.error("FFmpeg error output (last 20 lines):")
-                for line in stderr_output[-20:]:
-                    logger.error(f"  {line.strip()}")
+                for line in list(stderr_output)[-20:]:
+                    logger.error(f"  {line.decode(errors='replace').strip()}")
                 return False, ""
-                
+
         except Exception as e:
             logger.error(f"Error assembling video: {str(e)}")
             import traceback
             traceback.print_exc()
             return False, ""
 
+    def _prepare_render(
+        self,
+        folder_path: str,
+        progress_callback: Optional[Callable[[int, str], None]],
+        use_gpu: bool,
+        captions: Optional[List[Dict]]
+    ) -> Optional[Dict]:
+        """
+        Detect files, generate captions and build the FFmpeg command (blocking)
+
+        Returns:
+            Dict with 'cmd', 'env', 'duration', 'output_path', 'temp_srt' and
+            'work_dir', or None if the folder is invalid
+        """
+        logger.info("=" * 80)
+        logger.info("STARTING VIDEO ASSEMBLY")
+        logger.info("=" * 80)
+        logger.info(f"Folder: {folder_path}")
+        logger.info("Settings:")
+        logger.info(f"  - Font: {self.settings.get('font', 'N/A')}")
+        logger.info(f"  - Font Size: {self.settings.get('font_size', 'N/A')}")
+        logger.info(f"  - Text Color: {self.settings.get('text_color', 'N/A')}")
+        logger.info(f"  - BG Color: {self.settings.get('bg_color', 'N/A')}")
+        logger.info(f"  - BG Opacity: {self.settings.get('bg_opacity', 'N/A')}%")
+        logger.info(f"  - Has Background: {self.settings.get('has_background', 'N/A')}")
+        logger.info(f"  - Has Outline: {self.settings.get('has_outline', 'N/A')}")
+        logger.info(f"  - Outline Color: {self.settings.get('outline_color', 'N/A')}")
+        logger.info(f"  - Motion Effect: {self.settings.get('motion_effect', 'N/A')}")
+        logger.info(f"  - Caption Position: {self.settings.get('caption_position', 'N/A')}")
+        logger.info(f"  - Crop Settings: {self.settings.get('crop_settings', 'N/A')}")
+        logger.info("=" * 80)
+        
+        # Detect and validate files
+        is_valid, error, files = scan_folder(folder_path)
+        if not is_valid:
+            logger.error(f"Validation failed: {error}")
+            return None
+        
+        # Prepare output path
+        folder_name = os.path.basename(folder_path)
+        output_path = os.path.join(folder_path, f"{folder_name}.mp4")
+        
+        # Get audio duration
+        duration = self.get_audio_duration(files['voiceover'])
+        num_images = len(files['images'])
+        logger.info(f"Video duration: {duration:.2f} seconds, Images: {num_images}")
+        
+        # Generate captions (unless already generated by BatchRenderer)
+        if captions is None:
+            captions = self.generate_captions(
+                files['voiceover'], files['script'], progress_callback
+            )
+
+        # Create SRT file with natural wrapping approach
+        # Max 15 words / 75 chars - let FFmpeg WrapStyle=2 handle line breaks naturally
+        # This reduces caption cuts and allows text to flow smoothly to 2-3 lines
+        temp_srt = os.path.join(folder_path, 'temp_captions.srt')
+        text_case = self.settings.get('text_case', 'title')
+        work_dir = tempfile.mkdtemp(prefix='video_automator_')
+
+        # Optional: rasterize captions once instead of running libass per frame
+        caption_overlay = None
+        if self.settings.get('caption_renderer', 'libass') == 'overlay':
+            try:
+                prepared = CaptionGenerator.prepare_captions(
+                    captions, max_words=15, max_chars=75, text_case=text_case
+                )
+                caption_overlay = CaptionOverlayRenderer(
+                    self.settings, self.config.resolution
+                ).render(prepared, duration, work_dir)
+            except Exception as e:
+                logger.warning(f"Caption overlay rendering failed ({e}) - using subtitles filter")
+
+        if caption_overlay is None or self.settings.get('keep_srt', False):
+            CaptionGenerator.create_srt_file(captions, temp_srt, max_words=15, max_chars=75, text_case=text_case)
+        
+        # Pre-scale images once so FFmpeg doesn't scale/crop every frame
+        # (kept in the folder's _cache/ so re-renders skip unchanged images)
+        images_prescaled = False
+        if self.settings.get('prescale_images', True):
+            if progress_callback:
+                progress_callback(18, "Preparing images...")
+            try:
+                files = dict(files, images=ImagePrescaler.prescale_images(
+                    files['images'], self.config.resolution,
+                    os.path.join(folder_path, CACHE_DIR_NAME)
+                ))
+                images_prescaled = True
+            except Exception as e:
+                logger.warning(f"Image pre-scaling failed ({e}) - FFmpeg will scale instead")
+
+        # Build FFmpeg command
+        if progress_callback:
+            progress_callback(20, f"Assembling video with {num_images} image(s)...")
+        
+        ffmpeg_builder = FFmpegCommandBuilder(self.settings, self.config)
+        ffmpeg_cmd = ffmpeg_builder.build_command(
+            files, temp_srt, duration, output_path, use_gpu, images_prescaled, caption_overlay
+        )
+        
+        # Prepare environment for bundled fonts (EB Garamond)
+        env = os.environ.copy()
+        font = self.settings.get('font', 'Arial Bold')
+
+        if 'EB Garamond' in font:
+            # Use bundled EB Garamond fonts by setting fontconfig file
+            fonts_dir = get_resource_path('resources/fonts')
+            fonts_conf = os.path.join(fonts_dir, 'fonts.conf')
+
+            if os.path.exists(fonts_conf):
+                # Set fontconfig to use our custom configuration
+                env['FONTCONFIG_FILE'] = fonts_conf
+                env['FONTCONFIG_PATH'] = fonts_dir
+                logger.info(f"Using bundled EB Garamond fonts from: {fonts_dir}")
+                logger.info(f"Fontconfig file: {fonts_conf}")
+
+        return {
+            'cmd': ffmpeg_cmd,
+            'env': env,
+            'duration': duration,
+            'output_path': output_path,
+            'temp_srt': temp_srt,
+            'work_dir': work_dir
+        }
+
+    async def _run_ffmpeg(
+        self,
+        ffmpeg_cmd: List[str],
+        env: Dict,
+        duration: float,
+        progress_callback: Optional[Callable[[int, str], None]]
+    ) -> Tuple[int, deque]:
+        """
+        Run FFmpeg as an asyncio subprocess with progress tracking (-progress pipe:1 on stdout)
+
+        Returns:
+            Tuple of (return code, last stderr lines as bytes)
+        """
+        process = await asyncio.create_subprocess_exec(
+            *ffmpeg_cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+            limit=PIPE_LINE_LIMIT
+        )
+
+        # Progress parsing and stderr draining run as their own tasks so a full
+        # pipe can't stall FFmpeg; only the stderr tail is kept for error reporting
+        stderr_output = deque(maxlen=200)
+        reader_tasks = [
+            asyncio.create_task(_read_progress_async(process.stdout, duration, progress_callback)),
+            asyncio.create_task(_drain_stream_async(process.stderr, stderr_output))
+        ]
+
+        await process.wait()
+
+        # Pipes hit EOF as FFmpeg exits; don't let a stuck reader hold up the render
+        done, pending = await asyncio.wait(reader_tasks, timeout=1.0)
+        for task in pending:
+            task.cancel()
+        for task in done:
+            if task.exception() is not None:
+                logger.warning(f"FFmpeg pipe reader failed: {task.exception()!r}")
+
+        return process.returncode, stderr_output
+
 
 class BatchRenderer:
     """Handles parallel rendering of multiple videos"""
@@ -212,16 +518,43 @@ class BatchRenderer:
         
         Args:
             settings: Video style settings
-            max_workers: Maximum number of parallel renders
+            max_workers: Maximum number of parallel renders (clamped to the
+                NVENC session limit when encoding on the GPU)
         """
         self.settings = settings
-        self.max_workers = max_workers
-        self.processors = []
-        
-        # Create processor pool
-        for _ in range(max_workers):
-            self.processors.append(VideoProcessor(settings))
+        self.max_workers = self.limit_workers(settings, max_workers)
+
+        # One processor (and one Whisper model) shared by all renders -
+        # assemble_video keeps its per-video state in locals
+        self.processor = VideoProcessor(settings)
     
+    @staticmethod
+    def limit_workers(settings: Dict, max_workers: int) -> int:
+        """
+        Clamp a parallel render count to the NVENC session limit
+
+        Renders are FFmpeg subprocesses driven from one event loop and
+        transcription can run in a process pool (transcribe_workers), so
+        Python-side work doesn't serialize on the GIL. The real cap on
+        parallel renders is the number of NVENC sessions the driver allows:
+        one more and FFmpeg fails with "OpenEncodeSessionEx failed".
+
+        Args:
+            settings: Video style settings ('nvenc_session_limit' overrides the default)
+            max_workers: Requested number of parallel renders
+
+        Returns:
+            Number of parallel renders to use
+        """
+        session_limit = settings.get('nvenc_session_limit', NVENC_SESSION_LIMIT)
+        if session_limit and max_workers > session_limit and check_nvenc_available():
+            logger.warning(
+                f"⚠ {max_workers} parallel renders exceed the NVENC session limit - "
+                f"using {session_limit}"
+            )
+            return session_limit
+        return max_workers
+
     def process_queue(
         self,
         video_folders: List[str],
@@ -237,29 +570,125 @@ class BatchRenderer:
         Returns:
             List of (folder_path, success, output_path) tuples
         """
-        def process_single_video(folder_path: str, processor: VideoProcessor):
-            callback = progress_callbacks.get(folder_path)
-            
-            success, output_path = processor.assemble_video(
-                folder_path,
-                progress_callback=callback,
-                use_gpu=True
+        return asyncio.run(self._process_pipeline(video_folders, progress_callbacks))
+
+    async def _process_pipeline(
+        self,
+        video_folders: List[str],
+        progress_callbacks: Dict[str, Callable]
+    ) -> List[Tuple[str, bool, str]]:
+        """
+        Transcribe and render as a producer/consumer pipeline on one event loop
+
+        Caption jobs run in an executor (producer); each folder's render starts
+        as soon as its own captions are ready (consumer), so FFmpeg encodes one
+        video while Whisper is still working on the next. At most max_workers
+        FFmpeg processes run at a time.
+
+        Folders are transcribed in order of audio duration so short videos
+        reach the renderer first; faster-whisper batches each file's chunks
+        per GPU pass. Folders with a script.txt are force-aligned instead of
+        transcribed. With settings['transcribe_workers'] > 1 the jobs are
+        spread over a process pool (one model per process, no GIL contention),
+        otherwise they run one at a time on the shared in-process model.
+
+        Args:
+            video_folders: List of video project folder paths
+            progress_callbacks: Dict mapping folder paths to progress callbacks
+
+        Returns:
+            List of (folder_path, success, output_path) tuples in completion order
+        """
+        loop = asyncio.get_running_loop()
+        processor = self.processor
+        batch_size = self.settings.get('whisper_batch_size', 8)
+        jobs = self._caption_jobs(video_folders)
+
+        num_workers = min(self.settings.get('transcribe_workers', 1), len(jobs))
+        if num_workers > 1:
+            logger.info(f"Transcribing {len(jobs)} voiceover(s) in {num_workers} worker processes")
+            # 'spawn' everywhere: forking from a QThread of a process holding Qt and
+            # torch threads can deadlock the child (main.py calls freeze_support)
+            executor = ProcessPoolExecutor(
+                max_workers=num_workers, mp_context=multiprocessing.get_context('spawn')
             )
-            
+        else:
+            executor = ThreadPoolExecutor(max_workers=1)
+
+        # Producer: queue every caption job up front (executor preserves submit order)
+        captions_futures = {}
+        for duration, folder, voiceover, script in jobs:
+            callback = progress_callbacks.get(folder)
+            if num_workers > 1:
+                if callback:
+                    callback(5, "Generating captions...")
+                captions_futures[folder] = loop.run_in_executor(
+                    executor, _generate_captions_in_worker, self.settings, voiceover, script, batch_size
+                )
+            else:
+                captions_futures[folder] = loop.run_in_executor(
+                    executor, processor.generate_captions, voiceover, script, callback, batch_size
+                )
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        # Consumer: render each folder once its captions resolve
+        async def process_single_video(folder_path: str):
+            captions = None
+            if folder_path in captions_futures:
+                try:
+                    captions = await captions_futures[folder_path]
+                except Exception as e:
+                    logger.error(f"Transcription failed for {folder_path}: {e}")
+
+            async with semaphore:
+                success, output_path = await processor.assemble_video_async(
+                    folder_path,
+                    progress_callback=progress_callbacks.get(folder_path),
+                    use_gpu=True,
+                    captions=captions
+                )
+
+            logger.info(f"Completed: {folder_path} - Success: {success}")
             return folder_path, success, output_path
-        
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = []
-            
-            for i, folder in enumerate(video_folders):
-                processor = self.processors[i % len(self.processors)]
-                future = executor.submit(process_single_video, folder, processor)
-                futures.append(future)
-            
-            results = []
-            for future in as_completed(futures):
-                result = future.result()
-                results.append(result)
-                logger.info(f"Completed: {result[0]} - Success: {result[1]}")
-            
-            return results
\ No newline at end of file
+
+        try:
+            # Render in transcription order so the first captions ready are rendered first
+            ordered = [folder for _, folder, _, _ in jobs]
+            ordered += [folder for folder in video_folders if folder not in captions_futures]
+            tasks = [asyncio.ensure_future(process_single_video(folder)) for folder in ordered]
+            return [await task for task in asyncio.as_completed(tasks)]
+        finally:
+            executor.shutdown(wait=True)
+
+    def _caption_jobs(self, video_folders: List[str]) -> List[Tuple[float, str, str, Optional[str]]]:
+        """
+        Collect caption jobs ordered by audio duration
+
+        Args:
+            video_folders: List of video project folder paths
+
+        Returns:
+            List of (duration, folder, voiceover, script) tuples, shortest first
+        """
+        jobs = []
+        for folder in video_folders:
+            # A moved/deleted/unreadable folder must not abort the whole queue -
+            # it gets no caption job and assemble_video reports the failure
+            try:
+                voiceover, script = detect_caption_sources(folder)
+                if not voiceover:
+                    continue
+                try:
+                    duration = self.processor.get_audio_duration(voiceover)
+                except (subprocess.SubprocessError, ValueError) as e:
+                    logger.warning(f"Could not read duration of {voiceover}: {e}")
+                    duration = float('inf')
+            except Exception as e:
+                logger.error(f"Skipping captions for {folder}: {e}")
+                continue
+
+            jobs.append((duration, folder, voiceover, script))
+
+        jobs.sort(key=lambda job: job[0])
+        return jobs
@@ -5,6 +5,7 @@ Combines word limits + character limits + FFmpeg auto-wrapping safety net
 """
 
 import logging
+from pathlib import Path
 from typing import List, Dict
 import re
 
@@ -44,10 +45,11 @@ class CaptionGenerator:
         Returns:
             Formatted timestamp string
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
+        # Integer milliseconds avoid float drift (e.g. 2.999999 -> 2,999 instead of 3,000)
+        total_ms = max(0, round(seconds * 1000))
+        total_secs, millis = divmod(total_ms, 1000)
+        minutes, secs = divmod(total_secs, 60)
+        hours, minutes = divmod(minutes, 60)
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
     @staticmethod
@@ -204,17 +206,19 @@ class CaptionGenerator:
         return result
     
     @staticmethod
-    def create_srt_file(captions: List[Dict], output_path: str, split_long: bool = True, max_words: int = 12, max_chars: int = 50, text_case: str = 'title'):
+    def prepare_captions(captions: List[Dict], split_long: bool = True, max_words: int = 12, max_chars: int = 50, text_case: str = 'title') -> List[Dict]:
         """
-        Create SRT subtitle file from captions with intelligent splitting
+        Split, case and wrap captions into their final on-screen form
 
         Args:
             captions: List of caption dictionaries with 'start', 'end', 'text'
-            output_path: Path where SRT file will be saved
             split_long: Whether to split long captions (RECOMMENDED: True)
             max_words: Maximum words per caption (default: 12 = ~2 lines)
             max_chars: Maximum characters per caption (default: 50 = ensures 2-line wrapping)
             text_case: Text case style - 'title', 'upper', or 'normal' (default: 'title')
+
+        Returns:
+            List of caption dictionaries whose 'text' is ready to display
         """
         # Apply smart splitting if enabled
         if split_long:
@@ -223,21 +227,41 @@ class CaptionGenerator:
         else:
             logger.warning("⚠ Caption splitting disabled - long captions may overflow!")
 
-        # Write SRT file with text case transformation and wrapping
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for i, caption in enumerate(captions, 1):
-                start_time = CaptionGenerator.format_timestamp(caption['start'])
-                end_time = CaptionGenerator.format_timestamp(caption['end'])
-
-                # Apply text case transformation
-                caption_text = CaptionGenerator.apply_text_case(caption['text'], text_case)
+        # Apply text case transformation, then wrapping to ensure long captions split to 2 lines
+        return [
+            {
+                'start': caption['start'],
+                'end': caption['end'],
+                'text': CaptionGenerator.wrap_caption_text(
+                    CaptionGenerator.apply_text_case(caption['text'], text_case),
+                    max_line_chars=40
+                )
+            }
+            for caption in captions
+        ]
 
-                # Apply wrapping to ensure long captions split to 2 lines
-                caption_text = CaptionGenerator.wrap_caption_text(caption_text, max_line_chars=40)
+    @staticmethod
+    def create_srt_file(captions: List[Dict], output_path: str, split_long: bool = True, max_words: int = 12, max_chars: int = 50, text_case: str = 'title'):
+        """
+        Create SRT subtitle file from captions with intelligent splitting
 
-                f.write(f"{i}\n")
-                f.write(f"{start_time} --> {end_time}\n")
-                f.write(f"{caption_text}\n\n")
+        Args:
+            captions: List of caption dictionaries with 'start', 'end', 'text'
+            output_path: Path where SRT file will be saved
+            split_long: Whether to split long captions (RECOMMENDED: True)
+            max_words: Maximum words per caption (default: 12 = ~2 lines)
+            max_chars: Maximum characters per caption (default: 50 = ensures 2-line wrapping)
+            text_case: Text case style - 'title', 'upper', or 'normal' (default: 'title')
+        """
+        captions = CaptionGenerator.prepare_captions(captions, split_long, max_words, max_chars, text_case)
+
+        # Build the whole SRT in memory and write it in one call
+        format_timestamp = CaptionGenerator.format_timestamp
+        srt_content = ''.join(
+            f"{i}\n{format_timestamp(caption['start'])} --> {format_timestamp(caption['end'])}\n{caption['text']}\n\n"
+            for i, caption in enumerate(captions, 1)
+        )
+        Path(output_path).write_text(srt_content, encoding='utf-8')
         
         logger.info(f"✅ SRT file created: {output_path} ({len(captions)} caption segments)")
         
@@ -0,0 +1,210 @@
+"""
+Caption Overlay Renderer
+Rasterizes each caption segment to a transparent PNG once with Pillow and
+plays them back as a single concat-demuxer input, so FFmpeg only blends a
+pre-rendered band instead of running libass on every output frame
+"""
+
+import logging
+import os
+from typing import Dict, List, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+from utils.resource_path import get_font_path
+from .subtitle_style import SubtitleStyleBuilder
+
+logger = logging.getLogger(__name__)
+
+
+class CaptionOverlayRenderer:
+    """Renders caption segments to PNGs matching the ASS style settings"""
+
+    # FFmpeg converts SRT to ASS with PlayResY=288, so libass scales
+    # FontSize/Outline/Shadow/MarginV by video_height / 288
+    ASS_PLAY_RES_Y = 288
+
+    # Fallback font files tried when the named font isn't bundled
+    FONT_FILES = {
+        'Arial': 'arial.ttf',
+        'Arial Bold': 'arialbd.ttf',
+    }
+
+    def __init__(self, settings: Dict, resolution: tuple = (1920, 1080)):
+        """
+        Initialize caption overlay renderer
+
+        Args:
+            settings: Dictionary containing style settings
+            resolution: Output resolution as tuple (width, height)
+        """
+        self.settings = settings
+        self.resolution = resolution
+        self.scale = resolution[1] / self.ASS_PLAY_RES_Y
+
+    def _load_font(self, size: int) -> ImageFont.FreeTypeFont:
+        """Load the caption font at the given pixel size"""
+        font = self.settings.get('font', 'Arial Bold')
+        candidates = [get_font_path(font), self.FONT_FILES.get(font), f"{font}.ttf"]
+
+        for candidate in candidates:
+            if not candidate:
+                continue
+            try:
+                return ImageFont.truetype(candidate, size)
+            except OSError:
+                continue
+
+        logger.warning(f"Font '{font}' not found for caption overlay - using Pillow default")
+        try:
+            return ImageFont.load_default(size)
+        except TypeError:
+            return ImageFont.load_default()  # Pillow < 10.1 has no sized default font
+
+    @staticmethod
+    def _hex_to_rgba(hex_color: str, alpha: int = 255) -> tuple:
+        """Convert '#RRGGBB' to an RGBA tuple"""
+        r, g, b = bytes.fromhex(hex_color.lstrip('#')[:6])
+        return (r, g, b, alpha)
+
+    def _wrap_lines(self, draw: ImageDraw.ImageDraw, text: str, font, max_width: int) -> str:
+        """Re-wrap any line wider than max_width at word boundaries (WrapStyle=2 equivalent)"""
+        wrapped = []
+        for line in text.split('\n'):
+            current = ''
+            for word in line.split():
+                candidate = f"{current} {word}" if current else word
+                if current and draw.textlength(candidate, font=font) > max_width:
+                    wrapped.append(current)
+                    current = word
+                else:
+                    current = candidate
+            wrapped.append(current)
+        return '\n'.join(wrapped)
+
+    def render(self, captions: List[Dict], duration: float, output_dir: str) -> Tuple[str, int]:
+        """
+        Render caption PNGs and the concat playlist that times them
+
+        shadow_depth isn't rendered: libass draws the shadow in BackColour,
+        which SubtitleStyleBuilder makes fully transparent whenever there is
+        no background box, so the subtitles filter shows no shadow either.
+
+        Args:
+            captions: Prepared caption dictionaries ('start', 'end', final 'text')
+            duration: Total video duration in seconds
+            output_dir: Directory for the PNGs and playlist
+
+        Returns:
+            Tuple of (playlist path, y offset of the caption band in the frame)
+        """
+        width, height = self.resolution
+        font_size = max(1, round(self.settings.get('font_size', 48) * self.scale))
+        font = self._load_font(font_size)
+
+        text_color = self._hex_to_rgba(self.settings.get('text_color', '#FFFF00'))
+        has_background = self.settings.get('has_background', True)
+        has_outline = self.settings.get('has_outline', not has_background)
+
+        box_color = None
+        stroke_width = 0
+        stroke_color = None
+        if has_background:
+            opacity = int(self.settings.get('bg_opacity', 80) * 2.55)
+            box_color = self._hex_to_rgba(self.settings.get('bg_color', '#000000'), opacity)
+        elif has_outline:
+            stroke_width = round(self.settings.get('outline_width', 3) * self.scale)
+            stroke_color = self._hex_to_rgba(self.settings.get('outline_color', '#000000'))
+
+        # Same 10% side margins as SubtitleStyleBuilder
+        max_text_width = int(width * 0.8)
+        padding = max(stroke_width, font_size // 6)
+
+        measure = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+        laid_out = []
+        band_height = 0
+        for caption in captions:
+            text = self._wrap_lines(measure, caption['text'], font, max_text_width)
+            left, top, right, bottom = measure.multiline_textbbox(
+                (0, 0), text, font=font, align='center', stroke_width=stroke_width
+            )
+            laid_out.append((caption, text, (left, top, right, bottom)))
+            band_height = max(band_height, bottom - top + 2 * padding)
+        band_height = max(band_height, 2)
+
+        # Vertical placement uses the same alignment/MarginV as the libass style;
+        # MarginV is in script units, scaled like font size and outline
+        y_norm = self.settings.get('caption_position', {'x': 0.5, 'y': 0.95})['y']
+        v_align_base, margin_v = SubtitleStyleBuilder.vertical_placement(y_norm, height)
+        margin_px = int(margin_v * self.scale)
+        if v_align_base == 6:
+            anchor = 'top'
+            band_y = margin_px
+        elif v_align_base == 0:
+            anchor = 'bottom'
+            band_y = height - margin_px - band_height
+        else:
+            # libass ignores MarginV for middle alignment
+            anchor = 'middle'
+            band_y = (height - band_height) // 2
+        band_y = min(max(band_y, 0), height - band_height)
+
+        # Transparent frame shown between captions
+        blank_path = os.path.join(output_dir, 'caption_blank.png')
+        Image.new('RGBA', (width, band_height)).save(blank_path, 'PNG', compress_level=1)
+
+        playlist = []
+        current_time = 0.0
+        for i, (caption, text, (left, top, right, bottom)) in enumerate(laid_out):
+            start = max(caption['start'], current_time)
+            end = min(caption['end'], duration)
+            if end <= start:
+                continue
+
+            if start > current_time:
+                playlist.append((blank_path, start - current_time))
+
+            block_w, block_h = right - left, bottom - top
+            x = (width - block_w) // 2 - left
+            if anchor == 'top':
+                y = padding - top
+            elif anchor == 'bottom':
+                y = band_height - padding - block_h - top
+            else:
+                y = (band_height - block_h) // 2 - top
+
+            image = Image.new('RGBA', (width, band_height))
+            draw = ImageDraw.Draw(image)
+            if box_color:
+                draw.rectangle(
+                    (x + left - padding, y + top - padding, x + right + padding, y + bottom + padding),
+                    fill=box_color
+                )
+            draw.multiline_text(
+                (x, y), text, font=font, fill=text_color, align='center',
+                stroke_width=stroke_width, stroke_fill=stroke_color
+            )
+
+            caption_path = os.path.join(output_dir, f"caption_{i:04d}.png")
+            image.save(caption_path, 'PNG', compress_level=1)
+            playlist.append((caption_path, end - start))
+            current_time = end
+
+        if duration > current_time or not playlist:
+            playlist.append((blank_path, max(duration - current_time, 0.001)))
+
+        # The concat demuxer ignores the last entry's duration unless the file is repeated
+        playlist.append((playlist[-1][0], None))
+
+        playlist_path = os.path.join(output_dir, 'captions.txt')
+        lines = ["ffconcat version 1.0"]
+        for path, segment_duration in playlist:
+            path_normalized = path.replace('\\', '/')
+            lines.append(f"file '{path_normalized}'")
+            if segment_duration is not None:
+                lines.append(f"duration {segment_duration:.3f}")
+        with open(playlist_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+        logger.info(f"🖼 Rendered {len(laid_out)} caption overlay(s), band {width}x{band_height} at y={band_y}")
+        return playlist_path, band_y
@@ -5,16 +5,26 @@ UPDATED: Support for video overlay effects (real grain video files)
 """
 
 import logging
+import math
 import os
-import re
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from .motion_effects import MotionEffectBuilder
 from .subtitle_style import SubtitleStyleBuilder
-from .utils import check_gpu_available, get_video_duration
+from .utils import check_nvenc_available, check_nvenc_options, get_video_duration, get_video_pix_fmt
 from utils.resource_path import get_ffmpeg_path, get_font_path, get_resource_path
 
 logger = logging.getLogger(__name__)
 
+# Source pixel formats the scale_cuda -> hwdownload,format=nv12 chain handles
+# (8-bit 4:2:0 - 10-bit/4:2:2/4:4:4 intros would fail format negotiation)
+CUDA_SCALING_PIX_FMTS = frozenset({'yuv420p', 'yuvj420p', 'nv12'})
+
+# NVENC options that not every GPU generation / driver accepts
+NVENC_OPTIONAL_ARGS = (
+    ('-multipass', 'qres'),  # Cheap quarter-resolution first pass (SDK 10+)
+    ('-b_ref_mode', 'middle'),  # B-frames as references (Turing+)
+)
+
 
 class FFmpegCommandBuilder:
     """Builds FFmpeg commands for video assembly"""
@@ -29,6 +39,7 @@ class FFmpegCommandBuilder:
         """
         self.settings = settings
         self.config = config
+        self.nvenc_available = check_nvenc_available()
     
     def build_command(
         self,
@@ -36,17 +47,22 @@ class FFmpegCommandBuilder:
         srt_path: str,
         duration: float,
         output_path: str,
-        use_gpu: bool = True
+        use_gpu: bool = True,
+        images_prescaled: bool = False,
+        caption_overlay: Optional[Tuple[str, int]] = None
     ) -> List[str]:
         """
         Build complete FFmpeg command for video assembly
 
         Args:
             files: Dict with 'images', 'voiceover', 'intro_videos' paths
-            srt_path: Path to SRT subtitle file
+            srt_path: Path to SRT subtitle file (unused when caption_overlay is given)
             duration: Total video duration in seconds
             output_path: Output video file path
             use_gpu: Whether to use GPU acceleration
+            images_prescaled: Images are already at output resolution (no scale/crop)
+            caption_overlay: Optional (concat playlist path, band y offset) of
+                pre-rendered caption PNGs to overlay instead of the subtitles filter
 
         Returns:
             List of FFmpeg command arguments
@@ -60,10 +76,6 @@ class FFmpegCommandBuilder:
         if num_intro_videos > 0:
             logger.info(f"🎬 Found {num_intro_videos} intro video(s) - will add at start")
         
-        # Build subtitle style
-        style_builder = SubtitleStyleBuilder(self.settings, self.config.resolution)
-        subtitle_style = style_builder.build()
-        
         # Get motion effects (can be list or single string for backward compatibility)
         motion_effects = self.settings.get('motion_effects', None)
         
@@ -89,10 +101,32 @@ class FFmpegCommandBuilder:
         ffmpeg_cmd = get_ffmpeg_path()
         cmd = [ffmpeg_cmd, '-y']
         
-        # Hardware acceleration - disabled for compatibility with auto-fit scaling
-        # CUDA hwaccel causes "Function not implemented" errors with scale/crop filters
-        # Keep disabled to ensure filter chain works correctly
-        logger.info("CUDA hwaccel disabled for filter compatibility (auto-fit scaling)")
+        # Hardware acceleration - NVDEC decode for the video inputs only
+        # Frames are downloaded to system memory (no -hwaccel_output_format cuda)
+        # because xfade/overlay/subtitles are CPU filters; images are pre-scaled
+        # stills, so there is nothing to decode on the GPU for them
+        gpu_encode = use_gpu and self.nvenc_available
+        video_hwaccel = ['-hwaccel', 'cuda'] if gpu_encode else []
+        if gpu_encode:
+            logger.info("CUDA hwaccel enabled for intro/grain video decoding")
+
+        # Optional GPU pinning: the device index picks which GPU does both the
+        # NVDEC decode and the NVENC encode (each FFmpeg process still creates
+        # its own CUDA context on it)
+        gpu_device = self.settings.get('gpu_device')
+        if gpu_encode and gpu_device is not None:
+            video_hwaccel.extend(['-hwaccel_device', str(gpu_device)])
+            logger.info(f"Pinned decode/encode to GPU {gpu_device}")
+
+        # Optional: keep decoded intro frames in VRAM and scale them with scale_cuda,
+        # downloading only the (much smaller) scaled frame for crop/xfade.
+        # Needs FFmpeg >= 5.1 and an NVDEC-supported intro codec - hence opt-in.
+        # Decided per intro: only 8-bit 4:2:0 sources take the CUDA path
+        cuda_intro_scaling = gpu_encode and self.settings.get('cuda_intro_scaling', False)
+        cuda_scaled_intros = [
+            cuda_intro_scaling and get_video_pix_fmt(intro_path) in CUDA_SCALING_PIX_FMTS
+            for intro_path in intro_videos
+        ]
 
         # Track input indices
         current_input_index = 0
@@ -101,7 +135,13 @@ class FFmpegCommandBuilder:
         intro_start_index = 0
         if num_intro_videos > 0:
             intro_start_index = current_input_index
-            for intro_path in intro_videos:
+            for intro_path, cuda_scaled in zip(intro_videos, cuda_scaled_intros):
+                if cuda_scaled:
+                    cmd.extend([*video_hwaccel, '-hwaccel_output_format', 'cuda'])
+                else:
+                    if cuda_intro_scaling:
+                        logger.info(f"Intro isn't 8-bit 4:2:0 - scaling on the CPU: {intro_path}")
+                    cmd.extend(video_hwaccel)
                 cmd.extend(['-i', intro_path])
                 current_input_index += 1
                 logger.info(f"📹 Added intro video input [{current_input_index-1}]: {intro_path}")
@@ -119,12 +159,16 @@ class FFmpegCommandBuilder:
             time_per_image = (duration + transition_duration * (num_images - 1)) / num_images
             logger.info(f"📊 Adjusted time per image: {time_per_image:.2f}s (compensating for {num_images-1} crossfades)")
 
+        # One input per image on purpose: every image boundary is a 2s xfade,
+        # which needs both images as separate, overlapping streams. A single
+        # concat-demuxer input would only allow hard cuts between images.
+        # No '-loop 1': each still is read and decoded once, and the loop filter
+        # repeats the scaled frame instead of re-decoding the file every frame
         image_start_index = current_input_index
+        frames_per_image = max(1, math.ceil(time_per_image * fps))
         for img_path in images:
             cmd.extend([
-                '-loop', '1',
                 '-framerate', str(fps),
-                '-t', str(time_per_image),
                 '-i', img_path
             ])
             current_input_index += 1
@@ -174,6 +218,7 @@ class FFmpegCommandBuilder:
                         grain_path = video_overlay_info['path']
 
                         cmd.extend([
+                            *video_hwaccel,
                             '-stream_loop', '-1',
                             '-i', grain_path,
                             '-t', str(duration)
@@ -204,6 +249,7 @@ class FFmpegCommandBuilder:
                     grain_path = video_overlay_info['path']
 
                     cmd.extend([
+                        *video_hwaccel,
                         '-stream_loop', '-1',
                         '-i', grain_path,
                         '-t', str(duration)
@@ -220,6 +266,14 @@ class FFmpegCommandBuilder:
                 # Normal filter string only (Tilt, etc - no grain)
                 video_motion_filters = video_motion_result
         
+        # Add pre-rendered caption track (one concat-demuxer input for all PNGs)
+        caption_input_index = None
+        if caption_overlay:
+            caption_input_index = current_input_index
+            cmd.extend(['-f', 'concat', '-safe', '0', '-i', caption_overlay[0]])
+            current_input_index += 1
+            logger.info(f"💬 Added caption overlay track at index {caption_input_index}")
+
         # Build filter complex
         filter_parts = []
 
@@ -243,7 +297,13 @@ class FFmpegCommandBuilder:
             for i in range(num_intro_videos):
                 input_index = intro_start_index + i
                 # Crop/scale intro video to 16:9 (same as image autofit)
-                intro_filter = f"[{input_index}:v]scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height},fps={fps}[intro{i}]"
+                if cuda_scaled_intros[i]:
+                    intro_filter = (
+                        f"[{input_index}:v]scale_cuda={width}:{height}:force_original_aspect_ratio=increase,"
+                        f"hwdownload,format=nv12,crop={width}:{height},fps={fps}[intro{i}]"
+                    )
+                else:
+                    intro_filter = f"[{input_index}:v]scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height},fps={fps}[intro{i}]"
                 filter_parts.append(intro_filter)
                 intro_streams.append(f"[intro{i}]")
                 logger.info(f"🎬 Processing intro video {i}: crop to {width}x{height}")
@@ -291,22 +351,27 @@ class FFmpegCommandBuilder:
                 logger.info(f"🎬 Applied {num_intro_videos-1} xfade transitions between intro videos ({transition_duration}s each)")
 
         # Process each image - auto-fit each one individually (no saved crop settings)
-        for i, img_path in enumerate(images):
-            image_input_index = image_start_index + i
-            image_filter = MotionEffectBuilder.build_filter(
-                "Static",  # Not used in new version
-                time_per_image,
-                fps,
-                None,  # Always auto-fit each image individually
-                img_path,
-                self.config.resolution
-            )
-            filter_parts.append(f"[{image_input_index}:v]{image_filter}[v{i}]")
+        # Without crop settings the filter is the same for every image, so build it once
+        image_filter = MotionEffectBuilder.build_filter(
+            "Static",  # Not used in new version
+            time_per_image,
+            fps,
+            None,  # Always auto-fit each image individually
+            None,  # Image path only matters for crop validation
+            self.config.resolution,
+            prescaled=images_prescaled,
+            loop_frames=frames_per_image
+        )
+        filter_parts.extend(
+            f"[{image_start_index + i}:v]{image_filter}[v{i}]" for i in range(num_images)
+        )
         
         # Apply crossfade transitions between images (if multiple images)
+        # Streams are referenced by label directly - no pass-through copy nodes
+        images_output = "[vimages]"
         if num_images == 1:
             # Single image - no transitions needed
-            filter_parts.append(f"[v0]copy[vimages]")
+            images_output = "[v0]"
         else:
             # Multiple images - apply crossfade transitions
             # Build chain of xfade filters
@@ -346,12 +411,13 @@ class FFmpegCommandBuilder:
             last_intro_duration = intro_durations[-1] if intro_durations else 10.0
             offset_to_images = max(0, last_intro_duration - transition_duration)
 
-            xfade_filter = f"{intro_concat_output}[vimages]xfade=transition=fade:duration={transition_duration}:offset={offset_to_images}[vconcat]"
+            concat_output = "[vconcat]"
+            xfade_filter = f"{intro_concat_output}{images_output}xfade=transition=fade:duration={transition_duration}:offset={offset_to_images}{concat_output}"
             filter_parts.append(xfade_filter)
             logger.info(f"🎬 Applied xfade transition between intro videos and images (offset={offset_to_images:.2f}s, duration={transition_duration}s)")
         else:
-            # No intro videos, just rename vimages to vconcat
-            filter_parts.append(f"[vimages]copy[vconcat]")
+            # No intro videos - the image slideshow is the whole video
+            concat_output = images_output
         
         # Apply VIDEO-LEVEL effects AFTER concatenation
         if has_video_overlay and video_motion_filters:
@@ -361,7 +427,7 @@ class FFmpegCommandBuilder:
             opacity = video_overlay_info['opacity']
             
             # Step 1: Apply other motion filters to concatenated video
-            filter_parts.append(f"[vconcat]{video_motion_filters}[vfiltered]")
+            filter_parts.append(f"{concat_output}{video_motion_filters}[vfiltered]")
             
             # Step 2: Prepare grain overlay stream
             width, height = self.config.resolution
@@ -399,7 +465,7 @@ class FFmpegCommandBuilder:
             filter_parts.append(grain_filter)
             
             # Blend grain over main video
-            overlay_filter = f"[vconcat][grain]overlay[vmotion]"
+            overlay_filter = f"{concat_output}[grain]overlay[vmotion]"
             filter_parts.append(overlay_filter)
             
             video_input_for_subtitles = "[vmotion]"
@@ -407,25 +473,38 @@ class FFmpegCommandBuilder:
             
         elif video_motion_filters:
             # OTHER MOTION EFFECTS ONLY (Tilt, etc - no grain)
-            filter_parts.append(f"[vconcat]{video_motion_filters}[vmotion]")
+            filter_parts.append(f"{concat_output}{video_motion_filters}[vmotion]")
             video_input_for_subtitles = "[vmotion]"
             logger.info(f"Applied {len([e for e in motion_effects if e != 'Static'])} motion effect(s)")
             
         else:
             # NO MOTION EFFECTS (Static)
-            video_input_for_subtitles = "[vconcat]"
+            video_input_for_subtitles = concat_output
             logger.info("No motion effects applied (Static)")
         
         # Add subtitles to the final video stream
-        srt_path_normalized = srt_path.replace('\\', '/')
-        srt_path_escaped = srt_path_normalized.replace(':', r'\:').replace("'", r"'\''")
-        
-        subtitle_filter = f"{video_input_for_subtitles}subtitles='{srt_path_escaped}':force_style='{subtitle_style}'[vout]"
-        filter_parts.append(subtitle_filter)
-        
-        logger.info(f"Subtitle SRT: {srt_path}")
-        logger.info(f"Subtitle escaped: {srt_path_escaped}")
-        logger.info(f"Style: {subtitle_style}")
+        if caption_overlay:
+            # Blend the pre-rendered caption band; last caption frame is held
+            # until the next one, blank frames cover the gaps
+            caption_y = caption_overlay[1]
+            filter_parts.append(
+                f"{video_input_for_subtitles}[{caption_input_index}:v]overlay=0:{caption_y}:eof_action=pass[vout]"
+            )
+            logger.info(f"Caption overlay: {caption_overlay[0]} at y={caption_y}")
+        else:
+            # Build subtitle style
+            style_builder = SubtitleStyleBuilder(self.settings, self.config.resolution)
+            subtitle_style = style_builder.build()
+
+            srt_path_normalized = srt_path.replace('\\', '/')
+            srt_path_escaped = srt_path_normalized.replace(':', r'\:').replace("'", r"'\''")
+
+            subtitle_filter = f"{video_input_for_subtitles}subtitles='{srt_path_escaped}':force_style='{subtitle_style}'[vout]"
+            filter_parts.append(subtitle_filter)
+
+            logger.info(f"Subtitle SRT: {srt_path}")
+            logger.info(f"Subtitle escaped: {srt_path_escaped}")
+            logger.info(f"Style: {subtitle_style}")
         
         # Combine all filters
         filter_complex = ';'.join(filter_parts)
@@ -463,22 +542,33 @@ class FFmpegCommandBuilder:
         logger.info(f"Resolution: {width}x{height}, using H.264 level {h264_level}")
 
         # Video encoding
-        if use_gpu and check_gpu_available():
+        if gpu_encode:
+            gpu_pin = ('-gpu', str(gpu_device)) if gpu_device is not None else ()
             cmd.extend([
                 '-c:v', 'h264_nvenc',
-                '-preset', 'p1',
+                '-preset', 'p4',  # Same speed as p1 on Turing+ for slideshow content, better quality
                 '-tune', 'hq',
+                '-bf', '3'
+            ])
+            # GPU/driver-dependent options, each probed once and dropped if
+            # NVENC refuses to open with it
+            for option in NVENC_OPTIONAL_ARGS:
+                if check_nvenc_options(('-bf', '3', *option, *gpu_pin)):
+                    cmd.extend(option)
+                else:
+                    logger.info(f"NVENC doesn't support '{' '.join(option)}' here - skipping it")
+            cmd.extend([
                 '-rc', 'vbr',
                 '-cq', str(quality_cq),
                 '-b:v', target_bitrate,
                 '-maxrate', max_bitrate,
                 '-bufsize', '4M',
                 '-profile:v', 'high',
-                '-level', h264_level,
-                '-spatial-aq', '1',
-                '-temporal-aq', '1',
-                '-rc-lookahead', '20'
+                '-level', h264_level
+                # No spatial/temporal AQ or lookahead: slideshow frames barely change,
+                # so they only cost NVENC throughput
             ])
+            cmd.extend(gpu_pin)
             logger.info(f"Using GPU encoding with {fps} fps, CQ={quality_cq}")
         else:
             cmd.extend([
@@ -500,6 +590,9 @@ class FFmpegCommandBuilder:
         
         # Threading
         cmd.extend(['-threads', '0'])
+
+        # Machine-readable progress on stdout instead of the human stats line on stderr
+        cmd.extend(['-progress', 'pipe:1', '-nostats'])
         
         # Output
         cmd.append(output_path)
@@ -507,37 +600,33 @@ class FFmpegCommandBuilder:
         return cmd
     
     @staticmethod
-    def parse_progress(line: str, duration: float) -> tuple[int, str]:
+    def parse_progress(fields: Dict[str, str], duration: float) -> tuple[int, str]:
         """
-        Parse FFmpeg progress from stderr line
+        Turn one block of FFmpeg's machine-readable -progress output into a progress update
         
         Args:
-            line: FFmpeg stderr output line
+            fields: key=value pairs of one block (e.g. {'out_time_ms': '1234567', 'speed': '2.1x'})
             duration: Total video duration
             
         Returns:
-            Tuple of (progress_percent, status_message)
+            Tuple of (progress_percent, status_message), or (-1, "") if the
+            block carries no timing information yet
         """
-        # Try to parse frame number
-        frame_match = re.search(r'frame=\s*(\d+)', line)
-        if frame_match:
-            current_frame = int(frame_match.group(1))
-            total_frames = int(duration * 30)
-            progress = min(int((current_frame / total_frames) * 80), 79) + 20
-            current_time = current_frame / 30
-            status = f"Rendering video... {int(current_time)}/{int(duration)}s"
-            return progress, status
-        
-        # Try to parse time
-        time_match = re.search(r'time=(?:(\d{1,2}):)?(\d{1,2}):(\d{2}(?:\.\d{2})?)', line)
-        if time_match:
-            hours = int(time_match.group(1)) if time_match.group(1) else 0
-            minutes = int(time_match.group(2))
-            seconds = float(time_match.group(3))
-            current_time = hours * 3600 + minutes * 60 + seconds
-            
-            progress = min(int((current_time / duration) * 75), 75) + 20
-            status = f"Rendering video... {int(current_time)}/{int(duration)}s"
-            return progress, status
-        
-        return -1, ""
\ No newline at end of file
+        try:
+            # Despite the name, out_time_ms is in microseconds
+            current_time = int(fields.get('out_time_ms', '')) / 1_000_000
+        except ValueError:
+            return -1, ""  # 'N/A' before the first frame is written
+
+        if duration <= 0:
+            # Unknown total length - report elapsed output time only
+            return 20, f"Rendering video... {int(current_time)}s"
+
+        progress = min(int((current_time / duration) * 79), 79) + 20
+        status = f"Rendering video... {int(current_time)}/{int(duration)}s"
+
+        speed = fields.get('speed', 'N/A')
+        if speed != 'N/A':
+            status += f" ({speed.strip()})"
+
+        return progress, status
@@ -0,0 +1,143 @@
+"""
+Image Prescaler
+Resizes source images to the output resolution once before FFmpeg runs,
+so the filter graph doesn't scale/crop every frame of every image.
+Results persist in the project folder's _cache/ and are reused on re-renders
+"""
+
+import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+# Sub-folder of a project folder holding pre-scaled images (ignored by scan_folder)
+CACHE_DIR_NAME = '_cache'
+
+# Process umask, read once at import (os.umask can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+class ImagePrescaler:
+    """Pre-scales images to the exact output size (cover-fit, center crop)"""
+
+    JPEG_QUALITY = 92
+
+    @staticmethod
+    def cache_path(image_path: str, resolution: tuple, cache_dir: str) -> str:
+        """Pre-scaled image path for a source image at a given resolution"""
+        name = os.path.basename(image_path)
+        return os.path.join(cache_dir, f"{name}.{resolution[0]}x{resolution[1]}.jpg")
+
+    @staticmethod
+    def is_fresh(image_path: str, output_path: str) -> bool:
+        """Check that a pre-scaled image exists and is newer than its source"""
+        try:
+            return os.path.getmtime(output_path) >= os.path.getmtime(image_path)
+        except OSError:
+            return False
+
+    @staticmethod
+    def prune_cache(cache_dir: str, keep: List[str]) -> int:
+        """
+        Delete cache entries that aren't in keep (renamed/removed sources,
+        previous output resolutions, temp files of interrupted renders)
+
+        Args:
+            cache_dir: Cache directory of one project folder
+            keep: Pre-scaled image paths still in use
+
+        Returns:
+            Number of files removed
+        """
+        keep_names = {os.path.basename(path) for path in keep}
+        removed = 0
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name not in keep_names:
+                    try:
+                        os.remove(entry.path)
+                        removed += 1
+                    except OSError as e:
+                        logger.warning(f"Could not remove stale cache file {entry.path}: {e}")
+        return removed
+
+    @staticmethod
+    def prescale_image(image_path: str, output_path: str, resolution: tuple = (1920, 1080)) -> str:
+        """
+        Scale and center-crop one image to the output resolution
+
+        Matches FFmpeg's 'scale=W:H:force_original_aspect_ratio=increase,crop=W:H'.
+        The JPEG is written to a temp file and moved into place, so an
+        interrupted render never leaves a truncated cache entry behind.
+
+        Args:
+            image_path: Source image path
+            output_path: Destination JPEG path
+            resolution: Output resolution as tuple (width, height)
+
+        Returns:
+            Path of the pre-scaled image
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(output_path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f, Image.open(image_path) as img:
+                fitted = ImageOps.fit(img.convert('RGB'), resolution, Image.LANCZOS)
+                fitted.save(f, 'JPEG', quality=ImagePrescaler.JPEG_QUALITY)
+            # mkstemp creates 0600 files - give cache entries normal permissions
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return output_path
+
+    @staticmethod
+    def prescale_images(
+        images: List[str],
+        resolution: tuple,
+        cache_dir: str,
+        max_workers: int = None
+    ) -> List[str]:
+        """
+        Pre-scale images in parallel (Pillow releases the GIL while resampling)
+
+        Images whose cached copy is newer than the source are reused as-is;
+        entries no longer matching any source image are removed.
+
+        Args:
+            images: Source image paths
+            resolution: Output resolution as tuple (width, height)
+            cache_dir: Directory for the pre-scaled JPEGs (created if missing)
+            max_workers: Thread count (default: CPU count)
+
+        Returns:
+            Pre-scaled image paths in the same order as images
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        output_paths = [ImagePrescaler.cache_path(image, resolution, cache_dir) for image in images]
+        pruned = ImagePrescaler.prune_cache(cache_dir, output_paths)
+        if pruned:
+            logger.info(f"🗑 Removed {pruned} stale pre-scaled image(s) from {cache_dir}")
+        stale = [
+            (image, output_path) for image, output_path in zip(images, output_paths)
+            if not ImagePrescaler.is_fresh(image, output_path)
+        ]
+
+        if stale:
+            with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+                list(executor.map(
+                    lambda args: ImagePrescaler.prescale_image(*args, resolution),
+                    stale
+                ))
+
+        logger.info(
+            f"🖼 Pre-scaled {len(stale)} image(s) to {resolution[0]}x{resolution[1]}, "
+            f"{len(images) - len(stale)} reused from cache"
+        )
+        return output_paths
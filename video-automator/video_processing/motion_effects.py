@@ -35,7 +35,9 @@ class MotionEffectBuilder:
         fps: int,
         crop_settings: Optional[Dict] = None,
         image_path: Optional[str] = None,
-        resolution: tuple = (1920, 1080)
+        resolution: tuple = (1920, 1080),
+        prescaled: bool = False,
+        loop_frames: Optional[int] = None
     ) -> str:
         """
         Build FFmpeg filter for per-image processing (crop and scale only)
@@ -47,17 +49,27 @@ class MotionEffectBuilder:
             crop_settings: Optional crop region {'x', 'y', 'width', 'height'}
             image_path: Path to image file (needed for crop validation)
             resolution: Output resolution as tuple (width, height)
+            prescaled: Image is already exactly the output resolution (skip scale/crop)
+            loop_frames: Input is a single decoded frame - repeat it this many
+                times after scaling, so the image is decoded and scaled once
 
         Returns:
             FFmpeg filter string for image preparation
         """
-        # Build base filter with crop handling - no motion effects here
-        base_filter = MotionEffectBuilder._build_base_filter(
-            crop_settings, image_path, resolution
-        )
-
-        # Just apply base filter and fps - motion will be applied at video level
-        return f"{base_filter},fps={fps}"
+        filters = []
+        if not prescaled:
+            # Build base filter with crop handling - no motion effects here
+            filters.append(MotionEffectBuilder._build_base_filter(
+                crop_settings, image_path, resolution
+            ))
+
+        if loop_frames:
+            # Repeat the one scaled frame and retime the copies at the output rate
+            filters.append(f"loop=loop={loop_frames - 1}:size=1:start=0,setpts=N/{fps}/TB")
+
+        # Motion will be applied at video level
+        filters.append(f"fps={fps}")
+        return ",".join(filters)
     
     @staticmethod
     def build_video_level_filters(
@@ -0,0 +1,144 @@
+"""
+Script Aligner
+Aligns a folder's script.txt to its voiceover with CTC forced alignment
+Much cheaper than a full Whisper transcription when the text is already known
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import List, Dict
+
+import torch
+
+try:
+    from ctc_forced_aligner import (
+        load_audio,
+        load_alignment_model,
+        generate_emissions,
+        preprocess_text,
+        get_alignments,
+        get_spans,
+        postprocess_results
+    )
+    CTC_ALIGNER_AVAILABLE = True
+except ImportError:
+    CTC_ALIGNER_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Process-wide alignment model (loaded once, shared by all aligners)
+_ALIGNMENT_MODEL = None
+_ALIGNMENT_LOCK = threading.Lock()
+
+
+class ScriptAligner:
+    """Aligns known script text to audio and groups words into caption segments"""
+
+    def __init__(self, language: str = "eng", max_words: int = 5, max_duration: float = 3.0):
+        """
+        Initialize script aligner
+
+        Args:
+            language: ISO 639-3 language code of the script (default: 'eng')
+            max_words: Maximum words per caption segment
+            max_duration: Maximum caption segment duration in seconds
+        """
+        self.language = language
+        self.max_words = max_words
+        self.max_duration = max_duration
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check if the forced aligner package is installed"""
+        return CTC_ALIGNER_AVAILABLE
+
+    @staticmethod
+    def _get_model():
+        """Load the shared alignment model and tokenizer"""
+        global _ALIGNMENT_MODEL
+
+        with _ALIGNMENT_LOCK:
+            if _ALIGNMENT_MODEL is None:
+                device = "cuda" if torch.cuda.is_available() else "cpu"
+                dtype = torch.float16 if device == "cuda" else torch.float32
+                logger.info(f"Loading CTC alignment model on {device}...")
+                _ALIGNMENT_MODEL = load_alignment_model(device, dtype=dtype)
+                logger.info("✓ Alignment model loaded")
+
+            return _ALIGNMENT_MODEL
+
+    def align(self, audio_path: str, script_path: str) -> List[Dict]:
+        """
+        Align script text to audio
+
+        Args:
+            audio_path: Path to voiceover audio
+            script_path: Path to script.txt
+
+        Returns:
+            List of caption dictionaries with 'start', 'end', 'text' keys
+        """
+        text = Path(script_path).read_text(encoding='utf-8').strip()
+        if not text:
+            raise ValueError(f"Script is empty: {script_path}")
+
+        logger.info(f"Aligning script to audio: {script_path} → {audio_path}")
+
+        model, tokenizer = self._get_model()
+        waveform = load_audio(audio_path, model.dtype, model.device)
+
+        with _ALIGNMENT_LOCK:
+            emissions, stride = generate_emissions(model, waveform, batch_size=4)
+
+        tokens_starred, text_starred = preprocess_text(text, romanize=True, language=self.language)
+        segments, scores, blank_token = get_alignments(emissions, tokens_starred, tokenizer)
+        spans = get_spans(tokens_starred, segments, blank_token)
+        words = postprocess_results(text_starred, spans, stride, scores)
+
+        captions = self.group_words(words, self.max_words, self.max_duration)
+        logger.info(f"✓ Aligned {len(words)} words into {len(captions)} caption segments")
+        return captions
+
+    @staticmethod
+    def group_words(words: List[Dict], max_words: int = 5, max_duration: float = 3.0) -> List[Dict]:
+        """
+        Group word timings into caption segments
+
+        A segment ends at sentence punctuation, after max_words words, or
+        before it would exceed max_duration seconds.
+
+        Args:
+            words: List of word dictionaries with 'start', 'end', 'text'
+            max_words: Maximum words per segment
+            max_duration: Maximum segment duration in seconds
+
+        Returns:
+            List of caption dictionaries with 'start', 'end', 'text' keys
+        """
+        captions = []
+        current = []
+
+        def flush():
+            if current:
+                captions.append({
+                    'start': current[0]['start'],
+                    'end': current[-1]['end'],
+                    'text': ' '.join(w['text'] for w in current)
+                })
+                current.clear()
+
+        for word in words:
+            if current and (
+                len(current) >= max_words or
+                word['end'] - current[0]['start'] > max_duration
+            ):
+                flush()
+
+            current.append(word)
+
+            if word['text'].endswith(('.', '!', '?')):
+                flush()
+
+        flush()
+        return captions
@@ -7,6 +7,7 @@ Creates FFmpeg subtitle styling with:
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict
 
 logger = logging.getLogger(__name__)
@@ -15,6 +16,15 @@ logger = logging.getLogger(__name__)
 class SubtitleStyleBuilder:
     """Builds FFmpeg ASS subtitle style with intelligent wrapping boundaries"""
 
+    # Settings that affect the style string (cache key together with resolution)
+    STYLE_KEYS = (
+        'font', 'font_size', 'italic_text', 'text_color', 'bg_color', 'bg_opacity',
+        'has_background', 'has_outline', 'outline_width', 'outline_color', 'shadow_depth'
+    )
+
+    # Built style strings shared by all builders: {settings key: style}
+    _style_cache = {}
+
     def __init__(self, settings: Dict, resolution: tuple = (1920, 1080)):
         """
         Initialize subtitle style builder
@@ -26,13 +36,57 @@ class SubtitleStyleBuilder:
         self.settings = settings
         self.resolution = resolution
 
+    @staticmethod
+    def vertical_placement(y_norm: float, screen_height: int) -> tuple:
+        """
+        ASS vertical alignment and MarginV for a normalized caption y position
+
+        Args:
+            y_norm: Caption y position (0 = top, 1 = bottom)
+            screen_height: Output video height
+
+        Returns:
+            Tuple of (alignment base: 6 top / 3 middle / 0 bottom, MarginV in
+            script units - libass scales it by video_height / PlayResY)
+        """
+        if y_norm < 0.33:
+            # Top alignment
+            return 6, int(y_norm * screen_height)
+        elif y_norm > 0.66:
+            # Bottom alignment (default)
+            return 0, int((1.0 - y_norm) * screen_height)
+        else:
+            # Middle alignment
+            return 3, int((0.5 - y_norm) * screen_height)
+
+    def _cache_key(self) -> tuple:
+        """Hashable snapshot of the settings the style depends on"""
+        caption_pos = self.settings.get('caption_position', {'x': 0.5, 'y': 0.95})
+        return (
+            tuple(self.settings.get(key) for key in self.STYLE_KEYS),
+            (caption_pos['x'], caption_pos['y']),
+            tuple(self.resolution)
+        )
+
     def build(self) -> str:
         """
         Build complete subtitle style string for FFmpeg with wrapping safety net
 
+        The result is cached per settings/resolution, so batch renders with the
+        same style only compute (and log) it once.
+
         Returns:
             ASS style format string with optimal wrapping configuration
         """
+        key = self._cache_key()
+        style = self._style_cache.get(key)
+        if style is None:
+            style = self._build_style()
+            self._style_cache[key] = style
+        return style
+
+    def _build_style(self) -> str:
+        """Build the ASS style string from the current settings"""
         # Font settings - handle "Font Bold" format
         font = self.settings.get('font', 'Arial Bold')
         
@@ -125,18 +179,7 @@ class SubtitleStyleBuilder:
         logger.info(f"   ✅ Invisible boundary enforced - text will auto-wrap!")
         
         # Determine vertical alignment based on position
-        if y_norm < 0.33:
-            # Top alignment
-            v_align_base = 6
-            margin_v = int(y_norm * SCREEN_HEIGHT)
-        elif y_norm > 0.66:
-            # Bottom alignment (default)
-            v_align_base = 0
-            margin_v = int((1.0 - y_norm) * SCREEN_HEIGHT)
-        else:
-            # Middle alignment
-            v_align_base = 3
-            margin_v = int((0.5 - y_norm) * SCREEN_HEIGHT)
+        v_align_base, margin_v = self.vertical_placement(y_norm, SCREEN_HEIGHT)
         
         # Always use center alignment for best wrapping behavior
         h_align = 2  # Center horizontal alignment
@@ -182,7 +225,9 @@ class SubtitleStyleBuilder:
         
         return style
     
-    def _convert_color(self, hex_color: str, alpha: int = 0) -> str:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _convert_color(hex_color: str, alpha: int = 0) -> str:
         """
         Convert hex color to ASS format (&HAABBGGRR)
         
@@ -193,9 +238,6 @@ class SubtitleStyleBuilder:
         Returns:
             ASS format color string
         """
-        hex_color = hex_color.lstrip('#')
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
+        r, g, b = bytes.fromhex(hex_color.lstrip('#')[:6])
         
         return f"&H{alpha:02X}{b:02X}{g:02X}{r:02X}"
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""
+Transcript Cache
+Content-addressed on-disk cache of Whisper caption segments, so re-rendering
+a folder with an unchanged voiceover skips transcription entirely
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "video_automator" / "transcripts"
+
+
+class TranscriptCache:
+    """Stores caption segments as JSON keyed by audio content hash + settings tag"""
+
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize transcript cache
+
+        Args:
+            cache_dir: Cache directory (default: ~/.cache/video_automator/transcripts)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+
+    @classmethod
+    def hash_file(cls, path: str) -> str:
+        """Hash file contents (xxh64 when installed, otherwise BLAKE2b)"""
+        hasher = xxhash.xxh64() if xxhash is not None else hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(cls.CHUNK_SIZE), b''):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    @classmethod
+    def make_key(cls, audio_path: str, tag: str) -> str:
+        """
+        Build the cache key of an audio file
+
+        Args:
+            audio_path: Path to voiceover audio
+            tag: Transcription settings the captions are produced with (WhisperHandler.cache_tag)
+
+        Returns:
+            Cache key (content hash + tag)
+        """
+        return f"{cls.hash_file(audio_path)}-{tag}"
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """
+        Load cached captions
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Caption segments, or None on a cache miss
+        """
+        try:
+            with open(self.cache_dir / f"{key}.json", 'r', encoding='utf-8') as f:
+                captions = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        logger.info(f"✓ Transcript cache hit: {key} ({len(captions)} segments)")
+        return captions
+
+    def put(self, key: str, captions: List[Dict]):
+        """
+        Store captions atomically (temp file + os.replace)
+
+        Args:
+            key: Cache key from make_key()
+            captions: Caption segments to store
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            entry = self.cache_dir / f"{key}.json"
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(captions, f)
+                os.replace(tmp_path, entry)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write transcript cache: {e}")
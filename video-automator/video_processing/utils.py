@@ -4,65 +4,273 @@ Helper functions for system checks and file operations
 """
 
 import os
+import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from utils.resource_path import get_ffmpeg_path, get_ffprobe_path
 
+try:
+    import soundfile
+except ImportError:
+    soundfile = None
 
-def check_ffmpeg_installed() -> bool:
-    """Check if FFmpeg is installed and available"""
+try:
+    import mutagen
+except ImportError:
+    mutagen = None
+
+
+# Cached system checks (None = not probed yet) - the answers don't change
+# while the app runs, so each probe process is spawned at most once
+_NVENC_AVAILABLE = None
+_FFMPEG_AVAILABLE = None
+
+# Supported file extensions (audio is ordered by voiceover priority)
+AUDIO_EXTENSIONS = ('.mp3', '.wav', '.m4a', '.aac', '.ogg', '.flac')
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.webp'})
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mov', '.avi', '.mkv'})
+
+
+def _run_probe(cmd: List[str], check: bool = False) -> subprocess.CompletedProcess:
+    """
+    Run a short-lived probe process (ffprobe) with minimal spawn overhead
+
+    stdin is /dev/null and inherited descriptors aren't closed one by one
+    (close_fds=True scans up to the fd limit on every spawn).
+    """
+    return subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        check=check,
+        stdin=subprocess.DEVNULL,
+        close_fds=False,
+        bufsize=4096
+    )
+
+
+def _probe_format_duration(media_path: str, check: bool = False) -> float:
+    """Read the container duration with one ffprobe call (JSON output)"""
+    cmd = [
+        get_ffprobe_path(),
+        '-v', 'error',
+        '-print_format', 'json',
+        '-show_format',
+        media_path
+    ]
+
+    result = _run_probe(cmd, check=check)
     try:
+        return float(json.loads(result.stdout)['format']['duration'])
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"No duration reported for {media_path}") from e
+
+
+def check_ffmpeg_installed() -> bool:
+    """Check if FFmpeg is installed and available (probed once per process)"""
+    global _FFMPEG_AVAILABLE
+
+    if _FFMPEG_AVAILABLE is None:
+        try:
+            ffmpeg_cmd = get_ffmpeg_path()
+            subprocess.run([ffmpeg_cmd, '-version'], capture_output=True, check=True)
+            _FFMPEG_AVAILABLE = True
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            _FFMPEG_AVAILABLE = False
+
+    return _FFMPEG_AVAILABLE
+
+
+def check_nvenc_available() -> bool:
+    """
+    Check if FFmpeg can encode with NVENC (probed once per process)
+
+    Asks FFmpeg itself instead of nvidia-smi: the encoder list catches
+    FFmpeg builds without NVENC, and a one-frame test encode catches builds
+    that list h264_nvenc but have no usable NVIDIA GPU/driver behind it.
+    """
+    global _NVENC_AVAILABLE
+
+    if _NVENC_AVAILABLE is None:
         ffmpeg_cmd = get_ffmpeg_path()
-        subprocess.run([ffmpeg_cmd, '-version'], capture_output=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+        try:
+            encoders = subprocess.run(
+                [ffmpeg_cmd, '-hide_banner', '-encoders'],
+                capture_output=True, stdin=subprocess.DEVNULL
+            )
+            _NVENC_AVAILABLE = (
+                b'h264_nvenc' in encoders.stdout and _nvenc_test_encode(())
+            )
+        except OSError:
+            _NVENC_AVAILABLE = False
+
+    return _NVENC_AVAILABLE
 
 
-def check_gpu_available() -> bool:
-    """Check if NVIDIA GPU is available for encoding"""
+def _nvenc_test_encode(options: Tuple[str, ...]) -> bool:
+    """Encode a few frames with h264_nvenc and the given options - True if the encoder opened"""
+    cmd = [
+        get_ffmpeg_path(), '-hide_banner', '-loglevel', 'error',
+        '-f', 'lavfi', '-i', 'color=size=256x256:rate=30:duration=0.2',
+        '-c:v', 'h264_nvenc', *options, '-f', 'null', '-'
+    ]
     try:
-        result = subprocess.run(['nvidia-smi'], capture_output=True, text=True)
-        return result.returncode == 0
-    except FileNotFoundError:
+        result = subprocess.run(cmd, capture_output=True, stdin=subprocess.DEVNULL)
+    except OSError:
         return False
+    return result.returncode == 0
+
+
+@lru_cache(maxsize=None)
+def check_nvenc_options(options: Tuple[str, ...]) -> bool:
+    """
+    Check if h264_nvenc accepts a set of encoder options (probed once per option set)
+
+    Some NVENC options depend on the GPU generation or driver/SDK version
+    (e.g. '-b_ref_mode middle' needs Turing+, '-multipass' a recent SDK) and
+    make FFmpeg fail to open the encoder instead of being ignored.
+
+    Args:
+        options: Extra h264_nvenc arguments, e.g. ('-bf', '3', '-b_ref_mode', 'middle')
+
+    Returns:
+        True if NVENC is available and opens with these options
+    """
+    return check_nvenc_available() and _nvenc_test_encode(options)
 
 
 def get_audio_duration(audio_path: str) -> float:
-    """Get duration of audio file in seconds"""
-    ffprobe_cmd = get_ffprobe_path()
-    cmd = [
-        ffprobe_cmd,
-        '-v', 'error',
-        '-show_entries', 'format=duration',
-        '-of', 'default=noprint_wrappers=1:nokey=1',
-        audio_path
-    ]
+    """
+    Get duration of audio file in seconds
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return float(result.stdout.strip())
+    Reads the file header with soundfile (libsndfile) or mutagen when installed,
+    and only spawns ffprobe when neither can handle the format.
+    """
+    if soundfile is not None:
+        try:
+            return float(soundfile.info(audio_path).duration)
+        except RuntimeError:
+            pass  # Format not supported by this libsndfile build (e.g. m4a)
+
+    if mutagen is not None:
+        try:
+            audio = mutagen.File(audio_path)
+            if audio is not None and audio.info.length > 0:
+                return float(audio.info.length)
+        except mutagen.MutagenError:
+            pass
+
+    return _probe_format_duration(audio_path)
 
 
 def get_video_duration(video_path: str) -> float:
     """Get duration of video file in seconds"""
-    ffprobe_cmd = get_ffprobe_path()
+    try:
+        return _probe_format_duration(video_path, check=True)
+    except (subprocess.CalledProcessError, ValueError):
+        return 0.0
+
+
+def get_video_pix_fmt(video_path: str) -> str:
+    """Get the pixel format of a video's first video stream ('' if unknown)"""
     cmd = [
-        ffprobe_cmd,
+        get_ffprobe_path(),
         '-v', 'error',
-        '-show_entries', 'format=duration',
-        '-of', 'default=noprint_wrappers=1:nokey=1',
+        '-select_streams', 'v:0',
+        '-show_entries', 'stream=pix_fmt',
+        '-of', 'csv=p=0',
         video_path
     ]
-
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        return float(result.stdout.strip())
-    except (subprocess.CalledProcessError, ValueError):
-        return 0.0
+        return _run_probe(cmd, check=True).stdout.strip()
+    except (subprocess.CalledProcessError, OSError):
+        return ''
+
+
+def _list_folder_files(folder_path: str) -> Dict[str, any]:
+    """
+    Classify the files of a folder in a single os.scandir pass
+
+    Returns:
+        dict: {
+            'audio': {ext: [paths]} for supported audio extensions,
+            'images': image paths sorted by name,
+            'videos': video paths sorted by name,
+            'script': path to script.txt or None
+        }
+    """
+    folder = Path(folder_path)
+    listing = {
+        'audio': {},
+        'images': [],
+        'videos': [],
+        'script': None
+    }
+
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+
+            name = entry.name
+            ext = os.path.splitext(name)[1].lower()
+            if ext in IMAGE_EXTENSIONS:
+                listing['images'].append(name)
+            elif ext in AUDIO_EXTENSIONS:
+                listing['audio'].setdefault(ext, []).append(name)
+            elif ext in VIDEO_EXTENSIONS:
+                listing['videos'].append(name)
+            elif name.lower() == 'script.txt':
+                listing['script'] = str(folder / name)
+
+    listing['images'] = [str(folder / name) for name in sorted(listing['images'])]
+    listing['videos'] = [str(folder / name) for name in sorted(listing['videos'])]
+    listing['audio'] = {
+        ext: [str(folder / name) for name in sorted(names)]
+        for ext, names in listing['audio'].items()
+    }
+
+    return listing
+
 
+def _pick_voiceover(listing: Dict[str, any]) -> Optional[str]:
+    """
+    Pick the voiceover from a folder listing by extension priority
+
+    Within the first extension that has files, 'voiceover{ext}' wins over
+    the alphabetically first file.
+    """
+    for ext in AUDIO_EXTENSIONS:
+        audio_files = listing['audio'].get(ext)
+        if audio_files:
+            preferred = f"voiceover{ext}"
+            return next(
+                (path for path in audio_files if os.path.basename(path).lower() == preferred),
+                audio_files[0]
+            )
+    return None
 
-def detect_intro_videos(folder_path: str, min_duration: float = 6.0, max_duration: float = 12.0) -> List[str]:
+
+def detect_caption_sources(folder_path: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Find the voiceover and script of a folder without probing intro videos
+
+    Returns:
+        tuple: (voiceover path or None, script.txt path or None)
+    """
+    listing = _list_folder_files(folder_path)
+    return _pick_voiceover(listing), listing['script']
+
+
+def detect_intro_videos(
+    folder_path: str,
+    min_duration: float = 6.0,
+    max_duration: float = 12.0,
+    video_paths: List[str] = None
+) -> List[str]:
     """
     Detect intro video files in folder with duration between min and max seconds
 
@@ -70,32 +278,37 @@ def detect_intro_videos(folder_path: str, min_duration: float = 6.0, max_duratio
         folder_path: Path to folder to search
         min_duration: Minimum video duration in seconds (default 6.0)
         max_duration: Maximum video duration in seconds (default 12.0)
+        video_paths: Optional pre-listed video files (skips the directory scan)
 
     Returns:
         List of video file paths sorted alphabetically
     """
-    folder = Path(folder_path)
-    video_exts = ['.mp4', '.mov', '.avi', '.mkv']
+    if video_paths is None:
+        video_paths = _list_folder_files(folder_path)['videos']
+
     intro_videos = []
+    if not video_paths:
+        return intro_videos
 
-    # Find all video files
-    all_videos = []
-    for ext in video_exts:
-        all_videos.extend(folder.glob(f'*{ext}'))
+    # Probe all durations concurrently - each ffprobe is a separate process
+    def probe(video_path):
+        try:
+            return get_video_duration(video_path), None
+        except Exception as e:
+            return None, e
 
-    # Sort alphabetically
-    all_videos = sorted(all_videos, key=lambda x: x.name)
+    with ThreadPoolExecutor(max_workers=min(len(video_paths), os.cpu_count() or 4)) as executor:
+        probed = list(executor.map(probe, video_paths))
 
     # Filter by duration
-    for video_path in all_videos:
-        try:
-            duration = get_video_duration(str(video_path))
-            if min_duration <= duration <= max_duration:
-                intro_videos.append(str(video_path))
-                print(f"[INTRO] Found intro video: {video_path.name} ({duration:.1f}s)")
-        except Exception as e:
-            print(f"[INTRO] Skipping {video_path.name}: {e}")
+    for video_path, (duration, error) in zip(video_paths, probed):
+        video_name = os.path.basename(video_path)
+        if error is not None:
+            print(f"[INTRO] Skipping {video_name}: {error}")
             continue
+        if min_duration <= duration <= max_duration:
+            intro_videos.append(video_path)
+            print(f"[INTRO] Found intro video: {video_name} ({duration:.1f}s)")
 
     if intro_videos:
         print(f"[INTRO] Total intro videos found: {len(intro_videos)}")
@@ -115,51 +328,29 @@ def detect_files_in_folder(folder_path: str) -> Dict[str, any]:
             'intro_videos': list of intro video paths (6-12 seconds)
         }
     """
-    folder = Path(folder_path)
+    listing = _list_folder_files(folder_path)
     detected = {
         'voiceover': None,
-        'script': None,
-        'images': [],
+        'script': listing['script'],
+        'images': listing['images'],
         'intro_videos': []
     }
 
-    # Look for audio files
-    audio_exts = ['.mp3', '.wav', '.m4a', '.aac', '.ogg', '.flac']
-    for ext in audio_exts:
-        audio_files = list(folder.glob(f'*{ext}')) + list(folder.glob(f'voiceover{ext}'))
-        if audio_files:
-            detected['voiceover'] = str(audio_files[0])
-            break
-
-    # Look for script
-    script_file = folder / 'script.txt'
-    if script_file.exists():
-        detected['script'] = str(script_file)
-
-    # Look for images
-    image_exts = ['.png', '.jpg', '.jpeg', '.webp']
-    all_images = []
-    for ext in image_exts:
-        all_images.extend(folder.glob(f'*{ext}'))
-
-    all_images = sorted(all_images, key=lambda x: x.name)
-    detected['images'] = [str(img) for img in all_images]
+    detected['voiceover'] = _pick_voiceover(listing)
 
     # Look for intro videos (6-12 seconds duration)
-    detected['intro_videos'] = detect_intro_videos(folder_path)
+    detected['intro_videos'] = detect_intro_videos(folder_path, video_paths=listing['videos'])
 
     return detected
 
 
-def validate_folder(folder_path: str) -> tuple[bool, str]:
+def _validate_detected(detected: Dict) -> tuple[bool, str]:
     """
-    Validate if folder has all required files
-    
+    Validate detected files of a folder
+
     Returns:
         tuple: (is_valid, info_message)
     """
-    detected = detect_files_in_folder(folder_path)
-    
     missing = []
     if not detected['voiceover']:
         missing.append('voiceover audio')
@@ -175,4 +366,26 @@ def validate_folder(folder_path: str) -> tuple[bool, str]:
     else:
         info = f"Found {num_images} images (will be distributed across video duration)"
     
-    return True, info
\ No newline at end of file
+    return True, info
+
+
+def validate_folder(folder_path: str) -> tuple[bool, str]:
+    """
+    Validate if folder has all required files
+    
+    Returns:
+        tuple: (is_valid, info_message)
+    """
+    return _validate_detected(detect_files_in_folder(folder_path))
+
+
+def scan_folder(folder_path: str) -> tuple[bool, str, Dict[str, any]]:
+    """
+    Detect and validate folder files with a single directory walk
+
+    Returns:
+        tuple: (is_valid, info_message, detected_files)
+    """
+    detected = detect_files_in_folder(folder_path)
+    is_valid, info = _validate_detected(detected)
+    return is_valid, info, detected
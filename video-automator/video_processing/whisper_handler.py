@@ -1,119 +1,362 @@
 """
 Whisper Handler
 Manages Whisper model loading and audio transcription with GPU/CPU fallback
+Backends: faster-whisper (CTranslate2, default), openai-whisper (fallback when
+another backend fails to load) and whisper.cpp (pywhispercpp, when installed)
 """
 
 import logging
+import threading
 import whisper
 import torch
 from typing import List, Dict
 from utils.resource_path import get_resource_path
 import os
 
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    WhisperModel = None
+    FASTER_WHISPER_AVAILABLE = False
+
+try:
+    # Batched chunk inference (faster-whisper >= 1.1)
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:
+    BatchedInferencePipeline = None
+
+try:
+    from pywhispercpp.model import Model as WhisperCppModel
+    WHISPERCPP_AVAILABLE = True
+except ImportError:
+    WhisperCppModel = None
+    WHISPERCPP_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Allow TF32 matmuls on Ampere+ GPUs for the openai-whisper (PyTorch) path
+torch.backends.cuda.matmul.allow_tf32 = True
+torch.backends.cudnn.allow_tf32 = True
+
+# Backend names accepted by WhisperHandler ('auto' picks the fastest installed one)
+WHISPER_BACKENDS = ('auto', 'faster-whisper', 'whispercpp', 'openai-whisper')
+
+# faster-whisper compute types used for precision='auto'
+# (INT8 weights with FP16 activations on GPU, CTranslate2's INT8 GEMM on CPU)
+AUTO_COMPUTE_TYPES = {'cuda': 'int8_float16', 'cpu': 'int8'}
+
+# Process-wide models shared by every WhisperHandler so parallel workers
+# don't each load their own copy into RAM/VRAM, keyed by
+# (backend, model_size, device, precision) - the lock also serializes
+# openai-whisper inference on a shared model
+_SHARED_MODELS = {}
+_WHISPER_LOCK = threading.Lock()
+
 
 class WhisperHandler:
     """Handles Whisper model loading and transcription"""
-    
-    def __init__(self):
+
+    def __init__(
+        self,
+        backend: str = "auto",
+        word_timestamps: bool = False,
+        model_size: str = "base",
+        precision: str = "auto"
+    ):
+        """
+        Initialize Whisper handler
+
+        Args:
+            backend: One of WHISPER_BACKENDS (default: 'auto')
+            word_timestamps: Run word-level alignment (slow - captions only use segments)
+            model_size: Whisper model size loaded on first use (default: 'base')
+            precision: 'auto', a faster-whisper compute type (e.g. 'int8_float16',
+                'float16') or 'float32' to disable reduced precision everywhere
+        """
         self.model = None
+        self.model_size = model_size
+        self.precision = precision
+        self.word_timestamps = word_timestamps
         self.device = None
+        self.backend = None
+        self.requested_backend = self._resolve_backend(backend)
         self.cuda_available = torch.cuda.is_available()
         self.failed_gpu = False
-        
+
         if self.cuda_available:
             logger.info("CUDA detected - will attempt GPU acceleration for Whisper")
         else:
             logger.info("No CUDA detected - will use CPU for Whisper")
-    
-    def load_model(self, model_size: str = "base"):
-        # Check for bundled model first
-        bundled_model = get_resource_path(f"models/{model_size}.pt")
-        
-        if self.cuda_available and not self.failed_gpu:
+
+    @staticmethod
+    def _resolve_backend(backend: str) -> str:
+        """Map a requested backend to one that is installed"""
+        if backend not in WHISPER_BACKENDS:
+            logger.warning(f"Unknown Whisper backend '{backend}', using auto")
+            backend = "auto"
+
+        if backend == "faster-whisper" and not FASTER_WHISPER_AVAILABLE:
+            logger.warning("faster-whisper is not installed - falling back")
+            backend = "auto"
+        elif backend == "whispercpp" and not WHISPERCPP_AVAILABLE:
+            logger.warning("pywhispercpp is not installed - falling back")
+            backend = "auto"
+
+        if backend == "auto":
+            backend = "faster-whisper" if FASTER_WHISPER_AVAILABLE else "openai-whisper"
+
+        return backend
+
+    @classmethod
+    def get_shared_model(cls, backend: str, model_size: str, device: str, precision: str = "auto"):
+        """
+        Return an already loaded process-wide model
+
+        Args:
+            backend: Resolved backend name
+            model_size: Whisper model size
+            device: 'cuda' or 'cpu'
+            precision: Precision the model was loaded with
+
+        Returns:
+            The shared model, or None if this configuration isn't loaded yet
+        """
+        return _SHARED_MODELS.get((backend, model_size, device, precision))
+
+    def cache_tag(self, batch_size: int = 1) -> str:
+        """
+        Identify every setting that changes the transcript (for TranscriptCache keys)
+
+        Args:
+            batch_size: Batch size the transcription would run with
+
+        Returns:
+            Tag string of backend, model, precision, word timestamps and
+            batched/sequential mode
+        """
+        batched = (
+            self.requested_backend == "faster-whisper" and
+            batch_size > 1 and
+            BatchedInferencePipeline is not None
+        )
+        return "-".join([
+            self.requested_backend,
+            self.model_size,
+            self.precision,
+            "words" if self.word_timestamps else "segments",
+            "batched" if batched else "sequential"
+        ])
+
+    def load_model(self, model_size: str = None, device: str = None):
+        """
+        Load the shared Whisper model (loaded once per process and configuration)
+
+        Args:
+            model_size: Whisper model size (e.g., 'base', 'small'; default: self.model_size)
+            device: 'cuda' or 'cpu' (default: CUDA when available)
+        """
+        if model_size is None:
+            model_size = self.model_size
+        self.model_size = model_size
+
+        if device is None:
+            device = "cuda" if self.cuda_available and not self.failed_gpu else "cpu"
+        if self.requested_backend == "whispercpp":
+            device = "cpu"  # GPU use is decided when whisper.cpp is built
+
+        with _WHISPER_LOCK:
+            shared = self.get_shared_model(self.requested_backend, model_size, device, self.precision)
+            if shared is not None:
+                self.model = shared
+                self.device = device
+                self.backend = self.requested_backend
+                logger.info(f"Reusing shared Whisper model '{model_size}' ({self.backend}, {self.device})")
+                return
+
             try:
-                logger.info(f"Loading Whisper model '{model_size}' on GPU (CUDA)...")
-                
-                # Use bundled model if exists
-                if os.path.exists(bundled_model):
-                    logger.info(f"Using bundled model: {bundled_model}")
-                    self.model = whisper.load_model(bundled_model, device="cuda")
-                else:
-                    logger.info("Downloading model (first time only)...")
-                    self.model = whisper.load_model(model_size, device="cuda")
-                
-                self.device = "cuda"
-                logger.info("✓ Whisper model loaded successfully on GPU")
+                self._load_on_device(self.requested_backend, model_size, device)
+            except Exception:
+                if self.requested_backend == "openai-whisper":
+                    raise
+                # Optional backends can fail where openai-whisper still works
+                # (e.g. no bundled CTranslate2 model and no network to fetch one)
+                logger.warning(f"⚠ {self.requested_backend} unavailable - falling back to openai-whisper")
+                self.requested_backend = "openai-whisper"
+                self._load_on_device(self.requested_backend, model_size, device)
+
+            _SHARED_MODELS[(self.backend, model_size, self.device, self.precision)] = self.model
+
+    def _load_on_device(self, backend: str, model_size: str, device: str):
+        """Load a model with one backend, on the GPU first (if requested) and then on the CPU"""
+        loader = {
+            'faster-whisper': self._load_faster_whisper,
+            'whispercpp': self._load_whispercpp,
+            'openai-whisper': self._load_openai_whisper
+        }[backend]
+
+        if device == "cuda":
+            try:
+                loader(model_size, "cuda")
                 return
             except Exception as e:
                 logger.warning(f"⚠ GPU loading failed: {str(e)}")
                 logger.info("Falling back to CPU...")
                 self.failed_gpu = True
-        
+                torch.cuda.empty_cache()
+
         try:
-            logger.info(f"Loading Whisper model '{model_size}' on CPU...")
-            
-            # Use bundled model if exists
-            if os.path.exists(bundled_model):
-                logger.info(f"Using bundled model: {bundled_model}")
-                self.model = whisper.load_model(bundled_model, device="cpu")
-            else:
-                logger.info("Downloading model (first time only)...")
-                self.model = whisper.load_model(model_size, device="cpu")
-            
-            self.device = "cpu"
-            logger.info("✓ Whisper model loaded successfully on CPU")
+            loader(model_size, "cpu")
         except Exception as e:
-            logger.error(f"✗ Failed to load Whisper model: {str(e)}")
+            logger.error(f"✗ Failed to load Whisper model ({backend}): {str(e)}")
             raise
-    def transcribe(self, audio_path: str) -> List[Dict]:
+
+    def _load_faster_whisper(self, model_size: str, device: str):
+        """Load model with faster-whisper (CTranslate2): int8_float16 on GPU, int8 on CPU by default"""
+        if self.precision == "auto":
+            compute_type = AUTO_COMPUTE_TYPES[device]
+        else:
+            compute_type = self.precision
+        logger.info(f"Loading faster-whisper model '{model_size}' on {device} ({compute_type})...")
+
+        # Prefer the bundled CTranslate2 model (see download_whisper_model.py) -
+        # otherwise faster-whisper downloads it from Hugging Face on first use
+        model_path = model_size
+        bundled_model = get_resource_path(f"models/faster-whisper-{model_size}")
+        if os.path.isdir(bundled_model):
+            logger.info(f"Using bundled model: {bundled_model}")
+            model_path = bundled_model
+
+        self.model = WhisperModel(model_path, device=device, compute_type=compute_type)
+        self.device = device
+        self.backend = "faster-whisper"
+        logger.info(f"✓ faster-whisper model loaded successfully on {device}")
+
+    def _load_whispercpp(self, model_size: str, device: str):
+        """Load model with whisper.cpp (GGML) - GPU use depends on how it was built"""
+        logger.info(f"Loading whisper.cpp model '{model_size}'...")
+
+        self.model = WhisperCppModel(model_size, n_threads=os.cpu_count() or 4, print_progress=False)
+        self.device = "cpu"
+        self.backend = "whispercpp"
+        logger.info("✓ whisper.cpp model loaded successfully")
+
+    def _load_openai_whisper(self, model_size: str, device: str):
+        """Load model with openai-whisper, preferring the bundled checkpoint"""
+        # Check for bundled model first
+        bundled_model = get_resource_path(f"models/{model_size}.pt")
+        logger.info(f"Loading Whisper model '{model_size}' on {device}...")
+
+        if os.path.exists(bundled_model):
+            logger.info(f"Using bundled model: {bundled_model}")
+            self.model = whisper.load_model(bundled_model, device=device)
+        else:
+            logger.info("Downloading model (first time only)...")
+            self.model = whisper.load_model(model_size, device=device)
+
+        self.device = device
+        self.backend = "openai-whisper"
+        logger.info(f"✓ Whisper model loaded successfully on {device}")
+
+    def transcribe(self, audio_path: str, batch_size: int = 1) -> List[Dict]:
         """
         Transcribe audio file to generate caption segments
-        
+
         Args:
             audio_path: Path to audio file
-            
+            batch_size: Audio chunks decoded per GPU pass (faster-whisper only)
+
         Returns:
             List of caption dictionaries with 'start', 'end', 'text' keys
         """
         if not self.model:
             self.load_model()
-        
-        logger.info(f"Transcribing audio: {audio_path} (device: {self.device})")
-        
-        transcribe_options = {
-            'word_timestamps': True,
-            'verbose': False
-        }
-        
-        if self.device == "cuda":
-            transcribe_options['fp16'] = False
-            logger.info("Using FP32 precision on GPU (more stable)")
-        
+
+        logger.info(f"Transcribing audio: {audio_path} (backend: {self.backend}, device: {self.device})")
+
         try:
-            result = self.model.transcribe(audio_path, **transcribe_options)
-            
-            captions = []
-            for segment in result['segments']:
-                captions.append({
-                    'start': segment['start'],
-                    'end': segment['end'],
-                    'text': segment['text'].strip()
-                })
-            
+            if self.backend == "faster-whisper":
+                captions = self._transcribe_faster_whisper(audio_path, batch_size)
+            elif self.backend == "whispercpp":
+                captions = self._transcribe_whispercpp(audio_path)
+            else:
+                captions = self._transcribe_openai_whisper(audio_path)
+
             logger.info(f"✓ Generated {len(captions)} caption segments")
             return captions
-            
+
         except Exception as e:
             logger.error(f"✗ Transcription failed on {self.device}: {str(e)}")
-            
+
             if self.device == "cuda" and not self.failed_gpu:
                 logger.warning("⚠ GPU transcription failed, retrying on CPU...")
                 self.failed_gpu = True
                 self.model = None
-                self.load_model()
-                return self.transcribe(audio_path)
+                with _WHISPER_LOCK:
+                    _SHARED_MODELS.pop((self.backend, self.model_size, "cuda", self.precision), None)
+                torch.cuda.empty_cache()
+                self.load_model(device="cpu")
+                return self.transcribe(audio_path, batch_size)
             else:
                 logger.error("Cannot recover from transcription error")
-                raise
\ No newline at end of file
+                raise
+
+    def _transcribe_faster_whisper(self, audio_path: str, batch_size: int = 1) -> List[Dict]:
+        """Transcribe with faster-whisper - segments are consumed from its generator"""
+        model = self.model
+        options = {}
+        if batch_size > 1 and BatchedInferencePipeline is not None:
+            # Decode several VAD chunks of the same file in one batch
+            model = BatchedInferencePipeline(model=self.model)
+            options['batch_size'] = batch_size
+            # The batched pipeline defaults to one untimed segment per VAD
+            # chunk (up to 30s) - keep Whisper's own segment timestamps
+            options['without_timestamps'] = False
+
+        segments, _ = model.transcribe(
+            audio_path,
+            vad_filter=True,
+            word_timestamps=self.word_timestamps,
+            beam_size=1,
+            condition_on_previous_text=False,
+            **options
+        )
+        return [
+            {'start': segment.start, 'end': segment.end, 'text': segment.text.strip()}
+            for segment in segments
+        ]
+
+    def _transcribe_whispercpp(self, audio_path: str) -> List[Dict]:
+        """Transcribe with whisper.cpp - segment times are in 10 ms units"""
+        segments = self.model.transcribe(audio_path)
+        return [
+            {'start': segment.t0 / 100.0, 'end': segment.t1 / 100.0, 'text': segment.text.strip()}
+            for segment in segments
+        ]
+
+    def _transcribe_openai_whisper(self, audio_path: str) -> List[Dict]:
+        """Transcribe with openai-whisper"""
+        # Greedy single-pass decoding: no word-level DTW, no beam search,
+        # no temperature fallback and no growing previous-text prompt
+        transcribe_options = {
+            'word_timestamps': self.word_timestamps,
+            'condition_on_previous_text': False,
+            'beam_size': 1,
+            'best_of': 1,
+            'temperature': 0.0,
+            'verbose': False
+        }
+
+        # Half precision on GPU (tensor cores) unless FP32 was requested;
+        # openai-whisper forces FP32 on CPU itself
+        transcribe_options['fp16'] = self.device == "cuda" and self.precision != "float32"
+
+        # openai-whisper models aren't safe to run from several threads at once;
+        # faster-whisper and whisper.cpp are reentrant and skip the lock
+        with _WHISPER_LOCK:
+            result = self.model.transcribe(audio_path, **transcribe_options)
+
+        return [
+            {'start': segment['start'], 'end': segment['end'], 'text': segment['text'].strip()}
+            for segment in result['segments']
+        ]